@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+
+from app.core.dependencies import require_role
+from app.db.session import pool_stats
+from app.schemas.user import UserRole
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_role(UserRole.ADMIN))],
+)
+
+
+@router.get("/db-pool")
+async def read_db_pool_stats():
+    return pool_stats()
@@ -1,19 +1,37 @@
+from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordRequestForm
 from app.schemas.auth import TokenResponse
 from sqlalchemy import select
-from app.schemas.auth import LoginRequest, TokenResponse
+from app.schemas.auth import LoginRequest, TokenResponse, RefreshRequest
 from app.core.security import verify_password, create_access_token
+from app.core.security import create_refresh_token, decode_access_token, REFRESH_TOKEN_TYPE
+from app.db.queries import USER_BY_ID
 from app.db.session import get_db
 from app.db.models.user import User
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, require_role
+from app.core.principal import Principal
+from app.core.auth_cache import cache_stats
+from app.schemas.user import UserRole
 from app.schemas.user import UserCreate
 from app.core.security import hash_password
+from app.core.config import settings
+from app.core.hashing import password_pool
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
+def issue_access_token(user: User) -> str:
+    if settings.jwt_embed_claims:
+        return create_access_token(
+            subject=str(user.id),
+            expires_delta=timedelta(minutes=settings.claims_token_expire_minutes),
+            claims=Principal.from_user(user).to_claims(),
+        )
+    return create_access_token(subject=str(user.id))
+
+
 @router.post("/login", response_model=TokenResponse)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
@@ -24,27 +42,72 @@ async def login(
     )
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user or not await password_pool.run(
+        verify_password, form_data.password, user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid credentials",
         )
 
-    access_token = create_access_token(subject=str(user.id))
+    response = {
+        "access_token": issue_access_token(user),
+        "token_type": "bearer",
+    }
+    if settings.jwt_embed_claims:
+        response["refresh_token"] = create_refresh_token(subject=str(user.id))
+
+    return response
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(
+    data: RefreshRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """A new access token for a refresh token, with claims re-read from
+    the user row: one query and no password check."""
+    payload = decode_access_token(data.refresh_token)
+    if payload is None or payload.get("type") != REFRESH_TOKEN_TYPE:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
+
+    result = await db.execute(USER_BY_ID, {"user_id": payload["sub"]})
+    user = result.scalar_one_or_none()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
 
     return {
-        "access_token": access_token,
+        "access_token": issue_access_token(user),
         "token_type": "bearer",
     }
 
 @router.get("/me")
-async def read_me(current_user: User = Depends(get_current_user)):
+async def read_me(current_user: Principal = Depends(get_current_user)):
     return {
         "id": str(current_user.id),
         "email": current_user.email,
         "role": current_user.role,
     }
 
+@router.get(
+    "/cache-stats",
+    dependencies=[Depends(require_role(UserRole.ADMIN))],
+)
+async def read_cache_stats():
+    return cache_stats()
+
+@router.get(
+    "/hashing-stats",
+    dependencies=[Depends(require_role(UserRole.ADMIN))],
+)
+async def read_hashing_stats():
+    return password_pool.stats()
+
 @router.post("/register", status_code=201)
 async def register(
     data: UserCreate,
@@ -59,7 +122,7 @@ async def register(
 
     user = User(
         email=data.email,
-        password_hash=hash_password(data.password),
+        password_hash=await password_pool.run(hash_password, data.password),
         role=data.role,
     )
 
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Response
+
+from app.core.auth_cache import cache_stats
+from app.core.hashing import password_pool
+from app.core.metrics import render, startup_seconds
+from app.core.task_cache import task_cache
+from app.core.task_events import task_events
+from app.db.session import pool_stats
+
+router = APIRouter(tags=["Metrics"])
+
+
+# Unauthenticated for the Prometheus scraper; keep it off public ingress
+@router.get("/metrics", include_in_schema=False)
+async def read_metrics():
+    body = render({
+        "taskflow_db_pool": ("Connection pool", pool_stats()),
+        "taskflow_cache": ("In-process cache", {**cache_stats(), "tasks": task_cache.stats()}),
+        "taskflow_password_hashing": ("Password hashing pool", {"password": password_pool.stats()}),
+        "taskflow_task_events": ("Task event stream", {"broker": task_events.stats()}),
+        "taskflow_startup": ("Startup", {"app": startup_seconds}),
+    })
+    return Response(body, media_type="text/plain; version=0.0.4; charset=utf-8")
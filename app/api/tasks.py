@@ -1,22 +1,52 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from uuid import UUID
-from sqlalchemy import or_
-from app.db.session import get_db
+from sqlalchemy import select, insert, update, func, tuple_, false, true, any_, bindparam, union_all
+from sqlalchemy import BigInteger, Text, cast
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from uuid import UUID, uuid4
+from sqlalchemy import and_, or_
+from app.db.session import get_db, get_read_db, AsyncSessionLocal, engine
+from app.db.task_import import import_tasks, parse_rows
+from app.db.queries import INSERT_TASK, TEAM_MEMBER_ID, UPDATE_TASK, USER_BY_ID
+from app.db.queries import TASK_RESPONSE_COLUMNS, task_list
 from app.db.models.task import Task
+from app.db.models.task_archive import TaskArchive
+from app.db.models.task_unassignment import TaskUnassignment
 from app.db.models.user import User
-from app.schemas.task import TaskCreate, TaskRead, TaskUpdate
+from app.schemas.task import TaskCreate, TaskRead, TaskUpdate, TaskBulkCreateResult
+from app.schemas.task import TaskBulkUpdate, TaskBulkUpdateResult, TaskImportResult
+from app.schemas.task import TaskStatsRow, TaskChanges, TaskArchived
+from app.db.models.task_count import TaskCount, UNASSIGNED
 from app.core.dependencies import get_current_user, require_role
 from app.db.models.user import UserRole
 from app.schemas.task import TaskResponse
-from app.db.models.task import TaskStatus
+from app.db.models.task import TaskStatus, SEARCH_CONFIG
 from app.core.dependencies import require_can_create_task
-from datetime import datetime 
+from app.core.principal import Principal
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.pagination import encode_rank_cursor, decode_rank_cursor
+from app.core.pagination import encode_watermark, decode_watermark
+from app.core.config import settings
+from app.core.etag import make_etag, etag_matches
+from app.db.task_versions import visible_version
+from app.core.task_cache import task_cache, evict_tasks
+from app.core.task_events import task_events
+import asyncio
+from datetime import datetime
+from typing import Literal
+import csv
+import io
+import json
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json, to_jsonable_python
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+def task_etag(task) -> str:
+    return make_etag(task.id, task.updated_at.isoformat())
+
+
 @router.post(
     "",
     response_model=TaskRead,
@@ -25,88 +55,714 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
 )
 async def create_task(
     data: TaskCreate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_can_create_task),
+    current_user: Principal = Depends(require_can_create_task),
 ):
     # Ensure user belongs to a team
-    if current_user.role == UserRole.Manager and not data.assignee_id:
+    if current_user.role == UserRole.MANAGER and not data.assignee_id:
         raise HTTPException(
             status_code=400,
             detail="Manager must assign task to a user"
         )
     
-    if current_user.role != UserRole.Admin  and not current_user.team_id:
+    if current_user.role != UserRole.ADMIN and not current_user.team_id:
         raise HTTPException(
             status_code=400,
             detail="User is not assigned to any team"
         )
 
     # Validate assignee belongs to same team
-    assignee = None
+    team_id = current_user.team_id
     if data.assignee_id:
         if current_user.role == UserRole.ADMIN:
-            result = await db.execute(
-                select(User).where(User.id == data.assignee_id)
-            )
+            result = await db.execute(USER_BY_ID, {"user_id": data.assignee_id})
+            assignee = result.scalar_one_or_none()
+            if assignee:
+                team_id = assignee.team_id
         else:
             result = await db.execute(
-            select(User).where(
-                User.id == data.assignee_id,
-                User.team_id == current_user.team_id,
+                TEAM_MEMBER_ID,
+                {"user_id": data.assignee_id, "team_id": current_user.team_id},
             )
-        )    
-        assignee = result.scalar_one_or_none()
+            assignee = result.scalar_one_or_none()
 
         if not assignee:
             raise HTTPException(
                 status_code=400, detail="Invalid assignee")
 
-    team_id = assignee.team_id if current_user.role == UserRole.ADMIN else current_user.team_id
-    
-    task = Task(
-        title=data.title,
-        description=data.description,
-        assigned_to_id=data.assignee_id,
-        created_by_id=current_user.id,
-        team_id = team_id,
-        status=TaskStatus.OPEN,
-    )
+    if team_id is None:
+        raise HTTPException(status_code=400, detail=no_team_error(data.assignee_id))
 
-    db.add(task)
+    result = await db.execute(
+        INSERT_TASK,
+        {
+            "title": data.title,
+            "description": data.description,
+            "assigned_to_id": data.assignee_id,
+            "created_by_id": current_user.id,
+            "team_id": team_id,
+            "status": TaskStatus.OPEN,
+        },
+    )
+    task = result.scalar_one()
     await db.commit()
-    await db.refresh(task)
 
+    response.headers["ETag"] = task_etag(task)
     return task
 
-@router.get("/", response_model=list[TaskResponse])
-async def list_tasks(
-    status: TaskStatus | None = Query(None),
-    assignee_id: UUID | None = Query(None),
+def no_team_error(assignee_id: UUID | None) -> str:
+    # A new task takes the ADMIN's assignee's team, else the creator's
+    if assignee_id:
+        return "Assignee is not assigned to any team"
+    return "User is not assigned to any team"
+
+
+TITLE_MAX_LENGTH = Task.__table__.c.title.type.length
+
+
+def uuid_array_param(ids) -> bindparam:
+    """A single uuid[] parameter, for ``= ANY(:ids)`` instead of a huge IN list."""
+    return bindparam(
+        "ids", list(ids), type_=ARRAY(PG_UUID(as_uuid=True)), unique=True
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=list[TaskBulkCreateResult],
+    dependencies=[Depends(require_role(UserRole.ADMIN, UserRole.MANAGER))]
+)
+async def create_tasks_bulk(
+    items: list[TaskCreate] = Body(..., max_length=settings.tasks_bulk_max_items),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_can_create_task),
+):
+    # Validate every assignee with one query; same rules as create_task
+    assignee_ids = {item.assignee_id for item in items if item.assignee_id}
+    assignee_teams: dict[UUID, UUID | None] = {}
+    if assignee_ids:
+        query = select(User.id, User.team_id).where(
+            User.id == any_(uuid_array_param(assignee_ids))
+        )
+        if current_user.role != UserRole.ADMIN:
+            query = query.where(User.team_id == current_user.team_id)
+        result = await db.execute(query)
+        assignee_teams = dict(result.all())
+
+    results: list[TaskBulkCreateResult | None] = [None] * len(items)
+    rows = []
+    row_indexes = []
+
+    for index, item in enumerate(items):
+        # Checked here, not in the schema, so one bad title fails its own
+        # item rather than the whole INSERT (or the whole request)
+        if len(item.title) > TITLE_MAX_LENGTH:
+            error = f"title is longer than {TITLE_MAX_LENGTH} characters"
+        elif current_user.role == UserRole.MANAGER and not item.assignee_id:
+            error = "Manager must assign task to a user"
+        elif item.assignee_id and item.assignee_id not in assignee_teams:
+            error = "Invalid assignee"
+        else:
+            error = None
+
+        # Same team resolution as create_task
+        if current_user.role == UserRole.ADMIN and item.assignee_id:
+            team_id = assignee_teams.get(item.assignee_id)
+        else:
+            team_id = current_user.team_id
+
+        if error is None and team_id is None:
+            error = no_team_error(item.assignee_id)
+
+        if error:
+            results[index] = TaskBulkCreateResult(index=index, error=error)
+            continue
+
+        rows.append({
+            "id": uuid4(),
+            "title": item.title,
+            "description": item.description,
+            "assigned_to_id": item.assignee_id,
+            "created_by_id": current_user.id,
+            "team_id": team_id,
+            "status": TaskStatus.OPEN,
+        })
+        row_indexes.append(index)
+
+    if rows:
+        # Multi-row INSERT ... RETURNING; SQLAlchemy splits it into pages
+        # to stay under asyncpg's bind parameter limit
+        result = await db.scalars(
+            insert(Task).returning(Task, sort_by_parameter_order=True),
+            rows,
+        )
+        created = result.all()
+        await db.commit()
+
+        for index, task in zip(row_indexes, created):
+            results[index] = TaskBulkCreateResult(
+                index=index, task=TaskRead.model_validate(task)
+            )
+
+    return results
+
+@router.patch(
+    "/bulk",
+    response_model=TaskBulkUpdateResult,
+    dependencies=[Depends(require_role(UserRole.ADMIN, UserRole.MANAGER))]
+)
+async def update_tasks_bulk(
+    data: TaskBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    criteria = data.filter
+    if not data.ids and not (
+        criteria and (criteria.status or criteria.assignee_id or criteria.team_id)
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="Provide task ids or a filter",
+        )
+
+    if data.ids and len(data.ids) > settings.tasks_bulk_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.tasks_bulk_max_items} ids per request",
+        )
+
+    patch = data.patch
+    values = {}
+    if patch.title is not None:
+        values["title"] = patch.title
+    if patch.description is not None:
+        values["description"] = patch.description
+    if patch.status is not None:
+        values["status"] = patch.status
+
+    # Validate assignee
+    if patch.assignee_id:
+        if current_user.role == UserRole.ADMIN:
+            result = await db.execute(
+                select(User.id).where(User.id == patch.assignee_id)
+            )
+        else:
+            result = await db.execute(
+                select(User.id).where(
+                    User.id == patch.assignee_id,
+                    User.team_id == current_user.team_id
+                )
+            )
+
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=400, detail="Invalid assignee")
+
+        values["assigned_to_id"] = patch.assignee_id
+
+    if not values:
+        raise HTTPException(status_code=400, detail="Nothing to update")
+
+    values["updated_at"] = func.now()
+
+    # MANAGER is scoped to their team like update_task
+    conditions = [Task.is_deleted == false()]
+    if current_user.role == UserRole.MANAGER:
+        conditions.append(Task.team_id == current_user.team_id)
+    if criteria and criteria.team_id:
+        conditions.append(Task.team_id == criteria.team_id)
+    if criteria and criteria.status:
+        conditions.append(Task.status == criteria.status)
+    if criteria and criteria.assignee_id:
+        conditions.append(Task.assigned_to_id == criteria.assignee_id)
+
+    if data.ids:
+        conditions.append(Task.id == any_(uuid_array_param(data.ids)))
+    else:
+        # Filter only: capped like the ids path, one page of tasks in id
+        # order per request rather than every match in one transaction
+        page = select(Task.id).where(*conditions)
+        if data.after:
+            page = page.where(Task.id > data.after)
+        page = page.order_by(Task.id).limit(settings.tasks_bulk_max_items)
+        conditions.append(Task.id.in_(page))
+
+    # One set-based UPDATE
+    stmt = (
+        update(Task)
+        .where(*conditions)
+        .values(**values)
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    )
+
+    result = await db.execute(stmt)
+    updated_ids = result.scalars().all()
+    await db.commit()
+    evict_tasks(*updated_ids)
+
+    # A full page may have more after it
+    more = not data.ids and len(updated_ids) == settings.tasks_bulk_max_items
+    return TaskBulkUpdateResult(
+        updated=len(updated_ids),
+        ids=updated_ids,
+        next=max(updated_ids) if more else None,
+    )
+
+@router.post(
+    "/import",
+    response_model=TaskImportResult,
+    dependencies=[Depends(require_role(UserRole.ADMIN))]
+)
+async def import_tasks_upload(
+    request: Request,
+    format: Literal["csv", "ndjson"] = Query("csv"),
+):
+    """Load a streamed CSV/NDJSON body through COPY (see app.db.task_import)."""
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        return await import_tasks(
+            raw.driver_connection,
+            parse_rows(request.stream(), format),
+        )
+
+# TaskResponse's field names, matching TASK_RESPONSE_COLUMNS
+TASK_RESPONSE_FIELDS = tuple(column.key for column in TASK_RESPONSE_COLUMNS)
+
+
+def visible_rows(query, model, current_user: Principal):
+    """Restrict a query on tasks or tasks_archive to what the user may see."""
+    if current_user.role == UserRole.ADMIN:
+        return query
+    if current_user.role == UserRole.MANAGER:
+        return query.where(model.team_id == current_user.team_id)
+    # MEMBER
+    return query.where(
+        or_(
+            model.created_by_id == current_user.id,
+            model.assigned_to_id == current_user.id,
+        )
+    )
+
+
+def visible_tasks_query(current_user: Principal):
+    """Live tasks the user is allowed to see, by role."""
+    return visible_rows(select(Task).where(Task.is_deleted == false()), Task, current_user)
+
+
+def task_list_query(
+    current_user: Principal,
+    status: TaskStatus | None = None,
+    assignee_id: UUID | None = None,
+    after: tuple[datetime, UUID] | None = None,
     skip: int = 0,
     limit: int = 10,
+):
+    """The exact statement and parameters list_tasks runs; shared with the
+    plan checks. The statement comes from app.db.queries.task_list, built
+    once per shape."""
+    query = task_list(
+        current_user.role,
+        status=status is not None,
+        assignee=assignee_id is not None,
+        after=after is not None,
+    )
+
+    # Pagination: stable (created_at, id) order, newest first.
+    # A cursor seeks past the last row of the previous page so every page
+    # costs the same; skip/offset is kept for older clients.
+    params = {
+        "team_id": current_user.team_id,
+        "user_id": current_user.id,
+        "status": status,
+        "assignee_id": assignee_id,
+        # Fetch one extra row to know whether another page exists
+        "limit": limit + 1,
+    }
+    if after:
+        params["after_created_at"], params["after_id"] = after
+    else:
+        params["skip"] = skip
+
+    return query, params
+
+
+def export_record(row) -> list:
+    """Row values encoded the way TaskResponse serializes them."""
+    # pydantic-core's encoder, as used for the response models: UTC
+    # datetimes end in Z, UUIDs and enums become strings
+    return to_jsonable_python(list(row))
+
+
+async def export_chunks(query, format: str):
+    # Own session: the stream outlives the request's get_db session.
+    # yield_per makes asyncpg use a server-side cursor, so only one
+    # batch of rows is ever in memory.
+    names = TASK_RESPONSE_FIELDS
+
+    if format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(names)
+        yield buffer.getvalue()
+
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(
+            query.execution_options(yield_per=settings.tasks_export_batch_size)
+        )
+        async for rows in result.partitions():
+            buffer = io.StringIO()
+            if format == "csv":
+                csv.writer(buffer).writerows(export_record(row) for row in rows)
+            else:
+                for row in rows:
+                    buffer.write(json.dumps(dict(zip(names, export_record(row)))))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+
+
+@router.get("/export")
+async def export_tasks(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    status: TaskStatus | None = Query(None),
+    current_user: Principal = Depends(get_current_user),
+):
+    query = (
+        visible_tasks_query(current_user)
+        .with_only_columns(*TASK_RESPONSE_COLUMNS)
+        .order_by(Task.created_at, Task.id)
+    )
+    if status:
+        query = query.where(Task.status == status)
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        export_chunks(query, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format}"'},
+    )
+
+
+@router.get("/events")
+async def stream_task_events(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Server-Sent Events for changes to tasks the caller can see.
+
+    Events: created / updated / deleted / archived with the task's ids,
+    sent to whoever may see the task before or after the change (so a
+    task reassigned away also reaches its old audience); resync when
+    events may have been missed or a statement changed too many rows
+    (refetch lists). Comment lines keep idle connections alive through
+    proxies. The stream ends once the caller's user is deleted or changes
+    role, team or email (see task_events_revalidate_seconds).
+    """
+    # The principal lookup may have checked out a connection; give it
+    # back rather than hold it for the life of the stream
+    await db.close()
+
+    subscriber = task_events.subscribe(current_user)
+
+    async def stream():
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscriber.queue.get(), timeout=settings.task_events_keepalive_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if subscriber.closed:
+                    # The caller's role or team changed, or the user is
+                    # gone; the client reconnects and authenticates again
+                    break
+                if subscriber.overflowed:
+                    subscriber.overflowed = False
+                    event = {"op": "resync"}
+                yield f"event: {event['op']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            task_events.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# Every transaction with a lower id has finished, so no row can still
+# commit with a change_xid below this
+COMMITTED_HORIZON = select(
+    cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger)
+).scalar_subquery()
+
+
+def task_changes_query(
+    current_user: Principal,
+    team_id: UUID | None = None,
+    after: tuple[int, UUID] | None = None,
+    limit: int = 500,
 ):
-    query = select(Task)
+    """The statement and parameters task_changes runs; shared with the
+    plan checks. Served by the (team_id, change_xid, id) index, or
+    (change_xid, id) for ADMINs across all teams; archived tasks by the
+    matching archived_xid indexes on tasks_archive.
+
+    Rows are ordered by the id of the transaction that wrote them and
+    returned only once it is below the snapshot horizon. A long write
+    transaction therefore holds the feed back until it commits instead
+    of committing behind a watermark already handed out.
+    """
+
+    def scoped(query, model):
+        query = visible_rows(query, model, current_user)
+        if current_user.role == UserRole.ADMIN and team_id:
+            return query.where(model.team_id == team_id)
+        if current_user.role == UserRole.MEMBER:
+            return query.where(model.team_id == current_user.team_id)
+        return query
+
+    live = scoped(
+        select(*TASK_RESPONSE_COLUMNS, Task.updated_at, Task.change_xid, Task.is_deleted)
+        .where(Task.change_xid < COMMITTED_HORIZON),
+        Task,
+    )
+
+    if not after:
+        # Nothing to delete on a client that has nothing yet
+        query = (
+            live.where(Task.is_deleted == false())
+            .order_by(Task.change_xid, Task.id)
+            .limit(limit + 1)
+        )
+        return query, {}
+
+    live = (
+        live.where(tuple_(Task.change_xid, Task.id) > tuple_(*after))
+        .order_by(Task.change_xid, Task.id)
+        .limit(limit + 1)
+    )
+
+    # Tasks archived since the watermark are gone for the client too
+    archived = (
+        scoped(
+            select(
+                *(getattr(TaskArchive, column.key) for column in TASK_RESPONSE_COLUMNS),
+                TaskArchive.archived_at.label("updated_at"),
+                TaskArchive.archived_xid.label("change_xid"),
+                true().label("is_deleted"),
+            ).where(TaskArchive.archived_xid < COMMITTED_HORIZON),
+            TaskArchive,
+        )
+        .where(tuple_(TaskArchive.archived_xid, TaskArchive.id) > tuple_(*after))
+        .order_by(TaskArchive.archived_xid, TaskArchive.id)
+        .limit(limit + 1)
+    )
+
+    branches = [live, archived]
+    if current_user.role == UserRole.MEMBER:
+        # Tasks reassigned away from the member are gone for them too,
+        # unless they have come back since (the live row says so)
+        me = current_user.id
+        branches.append(
+            select(
+                *(TaskUnassignment.task_id.label("id") if column.key == "id" else column
+                  for column in TASK_RESPONSE_COLUMNS),
+                Task.updated_at,
+                TaskUnassignment.change_xid,
+                true().label("is_deleted"),
+            )
+            .select_from(TaskUnassignment)
+            .outerjoin(Task, Task.id == TaskUnassignment.task_id)
+            .where(
+                TaskUnassignment.user_id == me,
+                TaskUnassignment.team_id == current_user.team_id,
+                TaskUnassignment.change_xid < COMMITTED_HORIZON,
+                tuple_(TaskUnassignment.change_xid, TaskUnassignment.task_id) > tuple_(*after),
+                or_(
+                    Task.id.is_(None),
+                    and_(Task.created_by_id != me, Task.assigned_to_id.is_distinct_from(me)),
+                ),
+            )
+            .order_by(TaskUnassignment.change_xid, TaskUnassignment.task_id)
+            .limit(limit + 1)
+        )
+
+    changes = union_all(*branches).subquery()
+    query = select(changes).order_by(changes.c.change_xid, changes.c.id).limit(limit + 1)
+    return query, {}
+
+
+@router.get("/changes", response_model=TaskChanges)
+async def task_changes(
+    since: str | None = Query(None),
+    team_id: UUID | None = Query(None),
+    limit: int = Query(500, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Tasks changed after the ``since`` watermark, in commit order.
+
+    Without ``since`` this is a full sync of live tasks; with it, deleted
+    and archived tasks, and for MEMBERs tasks reassigned away from them,
+    come back as ids in ``deleted``. Keep calling with ``next``
+    while ``has_more``. Reads the primary: rows arriving late on a lagging
+    replica would fall behind a watermark already handed out.
+
+    Feeds are per team (ADMINs may pass team_id), so a MEMBER sees changes
+    to their tasks in their current team. Watermarks from before the feed
+    was ordered by transaction are rejected with 400; sync again without
+    ``since``.
+    """
+    after = decode_watermark(since) if since else None
+    query, params = task_changes_query(current_user, team_id, after, limit)
+
+    result = await db.execute(query, params)
+    rows = result.all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return TaskChanges(
+        tasks=[row for row in rows if not row.is_deleted],
+        deleted=[row.id for row in rows if row.is_deleted],
+        next=encode_watermark(rows[-1].change_xid, rows[-1].id) if rows else since,
+        has_more=has_more,
+    )
+
+
+@router.get("/archive", response_model=list[TaskArchived])
+async def list_archived_tasks(
+    response: Response,
+    limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Tasks moved to tasks_archive by scripts.archive_tasks, newest first.
+
+    Same visibility as the live list; deleted tasks stay hidden. Paged by
+    (created_at, id) with an opaque cursor in X-Next-Cursor.
+    """
+    query = (
+        visible_rows(
+            select(TaskArchive).where(TaskArchive.is_deleted == false()),
+            TaskArchive,
+            current_user,
+        )
+        .order_by(TaskArchive.created_at.desc(), TaskArchive.id.desc())
+    )
+
+    if cursor:
+        query = query.where(
+            tuple_(TaskArchive.created_at, TaskArchive.id) < tuple_(*decode_cursor(cursor))
+        )
+
+    # Fetch one extra row to know whether another page exists
+    result = await db.execute(query.limit(limit + 1))
+    tasks = result.scalars().all()
+
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(tasks[-1].created_at, tasks[-1].id)
+
+    return tasks
+
+
+@router.get("/stats", response_model=list[TaskStatsRow])
+async def task_stats(
+    team_id: UUID | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Live task counts per (team, status, assignee) from task_counts.
+
+    Costs O(groups) rather than O(tasks). MEMBERs see counts of the tasks
+    assigned to them; the counters are not kept per creator. Archived
+    tasks are not counted.
+    """
+    query = select(TaskCount).where(TaskCount.count > 0)
 
-    # Role-based visibility
     if current_user.role == UserRole.ADMIN:
-        pass
+        if team_id:
+            query = query.where(TaskCount.team_id == team_id)
     elif current_user.role == UserRole.MANAGER:
-        query = query.where(Task.team_id == current_user.team_id)
+        query = query.where(TaskCount.team_id == current_user.team_id)
     else:  # MEMBER
         query = query.where(
-                or_(
-                    Task.created_by_id == current_user.id,
-                    Task.assigned_to_id == current_user.id,
-                )
-            )
+            TaskCount.team_id == current_user.team_id,
+            TaskCount.assigned_to_id == current_user.id,
+        )
 
+    result = await db.execute(query)
 
-    # Filters
-    if status:
-        query = query.where(Task.status == status)
+    return [
+        TaskStatsRow(
+            team_id=row.team_id,
+            status=row.status,
+            assignee_id=None if row.assigned_to_id == UNASSIGNED else row.assigned_to_id,
+            count=row.count,
+        )
+        for row in result.scalars()
+    ]
+
+
+@router.get("/search", response_model=list[TaskResponse])
+async def search_tasks(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=256),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Ranked full-text search over title and description.
+
+    Matches come from the GIN index on search_vector; results are ordered
+    by (rank, id) and paged with an opaque cursor in X-Next-Cursor.
+    """
+    tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank(Task.search_vector, tsquery).label("rank")
+
+    query = (
+        visible_tasks_query(current_user)
+        .add_columns(rank)
+        .where(Task.search_vector.op("@@")(tsquery))
+        .order_by(rank.desc(), Task.id.desc())
+    )
 
+    if cursor:
+        query = query.where(
+            tuple_(rank, Task.id) < tuple_(*decode_rank_cursor(cursor))
+        )
+
+    # Fetch one extra row to know whether another page exists
+    result = await db.execute(query.limit(limit + 1))
+    rows = result.all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = encode_rank_cursor(last.rank, last.Task.id)
+
+    return [row.Task for row in rows]
+
+
+@router.get("/", response_model=list[TaskResponse])
+async def list_tasks(
+    request: Request,
+    status: TaskStatus | None = Query(None),
+    assignee_id: UUID | None = Query(None),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, description=f"At most {settings.tasks_list_max_limit}; larger values are clamped"),
+    cursor: str | None = Query(None),
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_user),
+):
     if assignee_id:
         if current_user.role == UserRole.MEMBER:
             raise HTTPException(
@@ -116,10 +772,8 @@ async def list_tasks(
         # MANAGER: assignee must belong to same team
         if current_user.role == UserRole.MANAGER:
             result = await db.execute(
-                select(User).where(
-                    User.id == assignee_id,
-                    User.team_id == current_user.team_id
-                )
+                TEAM_MEMBER_ID,
+                {"user_id": assignee_id, "team_id": current_user.team_id},
             )
             assignee = result.scalar_one_or_none()
 
@@ -128,15 +782,112 @@ async def list_tasks(
                     status_code=403,
                     detail="Assignee not in your team"
                 )
-        query = query.where(Task.assigned_to_id == assignee_id)
 
-    # Pagination
-    query = query.offset(skip).limit(limit)
+    # Conditional GET: the team change version identifies the list, so an
+    # unchanged list costs one primary-key lookup and no rows
+    etag = make_etag(
+        await visible_version(db, current_user),
+        current_user.id,
+        current_user.role.value,
+        current_user.team_id,
+        sorted(request.query_params.multi_items()),
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    headers = {"ETag": etag}
 
-    result = await db.execute(query)
-    tasks = result.scalars().all()
+    after = decode_cursor(cursor) if cursor else None
+    limit = min(limit, settings.tasks_list_max_limit)
+    query, params = task_list_query(current_user, status, assignee_id, after, skip, limit)
 
-    return tasks
+    result = await db.execute(query, params)
+    rows = result.all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+
+    # Row tuples go straight to JSON bytes; pydantic-core writes exactly
+    # what TaskResponse validation + JSONResponse would, much faster
+    return Response(
+        content=to_json([dict(zip(TASK_RESPONSE_FIELDS, row)) for row in rows]),
+        media_type="application/json",
+        headers=headers,
+    )
+
+async def write_denied(
+    db: AsyncSession,
+    task_id: UUID,
+    current_user: Principal,
+) -> HTTPException:
+    """Explain why a scoped UPDATE matched no row. Only runs on failure."""
+    result = await db.execute(
+        select(Task.team_id).where(Task.id == task_id, Task.is_deleted == false())
+    )
+    team_id = result.scalar_one_or_none()
+
+    if team_id is None:
+        return HTTPException(status_code=404, detail="Task not found")
+
+    # MANAGER can change only their team tasks
+    if current_user.role == UserRole.MANAGER and team_id != current_user.team_id:
+        return HTTPException(status_code=403, detail="Not allowed")
+
+    return HTTPException(status_code=400, detail="Invalid assignee")
+
+
+def scoped_write(task_id: UUID, current_user: Principal):
+    """UPDATE of one live task, restricted to what the user may change."""
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id, Task.is_deleted == false())
+        .execution_options(synchronize_session=False)
+    )
+    if current_user.role == UserRole.MANAGER:
+        stmt = stmt.where(Task.team_id == current_user.team_id)
+    return stmt
+
+
+@router.get("/{task_id}", response_model=TaskRead)
+async def read_task(
+    task_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    # A recent writer skips the cache: other workers may still hold the
+    # copy from before its write
+    task = None if db.info.get("pinned") else task_cache.get(task_id)
+    if task is None:
+        result = await db.execute(
+            select(Task).where(Task.id == task_id, Task.is_deleted == false())
+        )
+        row = result.scalar_one_or_none()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        task = TaskRead.model_validate(row)
+        # Only primary reads are cached: a lagging replica could put back
+        # the row a write has just evicted
+        if not db.info.get("replica"):
+            task_cache.set(task_id, task)
+
+    # Access is checked on every request, cached or not
+    if current_user.role == UserRole.MANAGER:
+        if task.team_id != current_user.team_id:
+            raise HTTPException(status_code=403, detail="Not allowed")
+    elif current_user.role == UserRole.MEMBER:
+        if current_user.id not in (task.created_by_id, task.assigned_to_id):
+            raise HTTPException(status_code=403, detail="Not allowed")
+
+    etag = task_etag(task)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return task
 
 @router.put(
     "/{task_id}",
@@ -146,55 +897,32 @@ async def list_tasks(
 async def update_task(
     task_id: UUID,
     data: TaskUpdate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
+    # A single UPDATE ... RETURNING: team scope and assignee checks are
+    # predicates, so the happy path is one statement
     result = await db.execute(
-        select(Task).where(Task.id == task_id)
+        UPDATE_TASK[current_user.role],
+        {
+            "task_id": task_id,
+            "new_title": data.title,
+            "new_description": data.description,
+            "new_status": data.status,
+            "assignee_id": data.assignee_id,
+            "scope_team_id": current_user.team_id,
+        },
     )
     task = result.scalar_one_or_none()
 
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    # MANAGER can update only their team tasks
-    if current_user.role == UserRole.MANAGER:
-        if task.team_id != current_user.team_id:
-            raise HTTPException(status_code=403, detail="Not allowed")
-
-    # Validate assignee
-    if data.assignee_id:
-        if current_user.role == UserRole.ADMIN:
-            result = await db.execute(
-                select(User).where(User.id == data.assignee_id)
-            )
-        else:
-            result = await db.execute(
-                select(User).where(
-                    User.id == data.assignee_id,
-                    User.team_id == current_user.team_id
-                )
-            )
-
-        assignee = result.scalar_one_or_none()
-        if not assignee:
-            raise HTTPException(status_code=400, detail="Invalid assignee")
-
-        task.assigned_to_id = data.assignee_id
-
-    # Update fields
-    if data.title is not None:
-        task.title = data.title
-    if data.description is not None:
-        task.description = data.description
-    if data.status is not None:
-        task.status = data.status
-
-    task.updated_at = datetime.utcnow()
+    if task is None:
+        raise await write_denied(db, task_id, current_user)
 
     await db.commit()
-    await db.refresh(task)
+    evict_tasks(task_id)
 
+    response.headers["ETag"] = task_etag(task)
     return task
 
 @router.delete(
@@ -205,22 +933,19 @@ async def update_task(
 async def delete_task(
     task_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
+    # Soft delete in a single UPDATE ... RETURNING
     result = await db.execute(
-        select(Task).where(Task.id == task_id)
+        scoped_write(task_id, current_user)
+        .values(is_deleted=True, updated_at=func.now())
+        .returning(Task.id)
     )
-    task = result.scalar_one_or_none()
 
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    # MANAGER can delete only their team tasks
-    if current_user.role == UserRole.MANAGER:
-        if task.team_id != current_user.team_id:
-            raise HTTPException(status_code=403, detail="Not allowed")
+    if result.one_or_none() is None:
+        raise await write_denied(db, task_id, current_user)
 
-    await db.delete(task)
     await db.commit()
+    evict_tasks(task_id)
 
     return None
@@ -0,0 +1,66 @@
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.models.user import User
+
+# token -> verified JWT payload, never kept past the token's exp
+token_cache = TTLCache(
+    maxsize=settings.auth_cache_size,
+    ttl=settings.auth_cache_ttl_seconds,
+)
+
+# str(user id) -> Principal
+principal_cache = TTLCache(
+    maxsize=settings.auth_cache_size,
+    ttl=settings.auth_cache_ttl_seconds,
+)
+
+
+def invalidate_user(user_id) -> None:
+    principal_cache.pop(str(user_id))
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    return {
+        "tokens": token_cache.stats(),
+        "principals": principal_cache.stats(),
+    }
+
+
+# Evict cached principals once a change to a user's role, team or email
+# (or the user's deletion) is committed. Evicting at flush time would let
+# a concurrent request re-cache the old row before the commit lands.
+# The cache is per process, so other workers converge within the TTL.
+
+def _mark_stale(target: User) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("stale_principals", set()).add(str(target.id))
+
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target):
+    state = inspect(target)
+    if any(
+        state.attrs[name].history.has_changes()
+        for name in ("role", "team_id", "email")
+    ):
+        _mark_stale(target)
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target):
+    _mark_stale(target)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_stale(session):
+    for user_id in session.info.pop("stale_principals", ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale(session):
+    session.info.pop("stale_principals", None)
@@ -7,10 +7,77 @@ class Settings(BaseSettings):
 
     database_url: str
     database_url_sync: str
+
+    # Optional read replica used by GET endpoints. After a write a client
+    # reads from the primary for read_your_writes_seconds; if the replica
+    # is unreachable reads go to the primary for replica_retry_seconds.
+    database_replica_url: str | None = None
+    read_your_writes_seconds: float = 5.0
+    replica_retry_seconds: float = 30.0
+
+    # Connection pool, per worker process. Total connections across the
+    # deployment are workers * (db_pool_size + db_max_overflow).
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = False
+    # asyncpg prepared statements cached per connection (0 for pgbouncer
+    # in transaction mode)
+    db_prepared_statement_cache_size: int = 100
+    # Connections opened at startup, each with the hot statements prepared,
+    # before the app takes traffic (0 skips the warm-up)
+    db_warm_connections: int = 2
+
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
+    # Sign role/team_id into access tokens so requests need no user lookup.
+    # Such tokens are short-lived to bound how stale those claims can be.
+    jwt_embed_claims: bool = False
+    claims_token_expire_minutes: int = 5
+    # Claims logins also get a refresh token: POST /auth/refresh re-reads
+    # the user and signs a fresh claims token, without bcrypt
+    refresh_token_expire_minutes: int = 24 * 60
+
+    # bcrypt runs in a "thread" or "process" pool; requests beyond
+    # workers + max_queue get a 503
+    password_hash_pool: str = "thread"
+    password_hash_workers: int = 4
+    password_hash_max_queue: int = 64
+
+    # GET /tasks/ page size; a larger limit is clamped to this rather than
+    # rejected, so older clients asking for big pages keep working
+    tasks_list_max_limit: int = 1000
+
+    # Largest batch accepted by the bulk task endpoints
+    tasks_bulk_max_items: int = 5000
+
+    # Rows fetched per server-side cursor round trip by /tasks/export
+    tasks_export_batch_size: int = 1000
+
+    # scripts.archive_tasks moves tasks to tasks_archive this long after
+    # their last change: deleted ones (kept a while for GET /tasks/changes
+    # tombstones and undo), and DONE ones
+    archive_deleted_after_days: int = 30
+    archive_done_after_days: int = 180
+
+    # Idle GET /tasks/events streams get a comment line this often
+    task_events_keepalive_seconds: float = 15.0
+    # Open streams are checked against users this often; a stream whose
+    # user was deleted or changed role, team or email is closed, and the
+    # client reconnects and re-authenticates
+    task_events_revalidate_seconds: float = 60.0
+
+    # In-process cache of single-task reads (0 disables)
+    task_cache_size: int = 10_000
+    task_cache_ttl_seconds: int = 30
+
+    # In-process cache of verified tokens and user principals (0 disables)
+    auth_cache_size: int = 10_000
+    auth_cache_ttl_seconds: int = 60
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
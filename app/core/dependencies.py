@@ -1,45 +1,62 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
-from app.db.models.user import User
+from app.db.queries import USER_BY_ID
 from app.schemas.user import UserRole
-from app.core.security import decode_access_token 
+from app.core.security import decode_access_token, REFRESH_TOKEN_TYPE
 from app.core.config import settings
+from app.core.principal import Principal
+from app.core.auth_cache import token_cache, principal_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
-) -> User:
+) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = decode_access_token(token)
+    payload = token_cache.get(token)
     if payload is None:
-        raise credentials_exception
+        payload = decode_access_token(token)
+        if payload is None:
+            raise credentials_exception
+        token_cache.set(token, payload, expires_at=payload["exp"])
 
     user_id: str | None = payload.get("sub")
-    if user_id is None:
+    if user_id is None or payload.get("type") == REFRESH_TOKEN_TYPE:
         raise credentials_exception
 
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
+    # Claims tokens carry role/team_id themselves: no lookup needed
+    try:
+        principal = Principal.from_claims(payload)
+    except (KeyError, TypeError, ValueError):
+        raise credentials_exception
+    if principal is not None:
+        return principal
+
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    result = await db.execute(USER_BY_ID, {"user_id": user_id})
     user = result.scalar_one_or_none()
 
     if user is None:
         raise credentials_exception
 
-    return user 
+    principal = Principal.from_user(user)
+    principal_cache.set(user_id, principal, expires_at=payload["exp"])
+
+    return principal
 
 def require_role(*roles: UserRole):
-    def checker(current_user: User = Depends(get_current_user)):
+    def checker(current_user: Principal = Depends(get_current_user)):
         if current_user.role not in roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -49,7 +66,7 @@ def require_role(*roles: UserRole):
 
     return checker
 
-def require_same_team(resource_team_id: int, user: User):
+def require_same_team(resource_team_id: int, user: Principal):
     if user.role == UserRole.ADMIN:
         return
 
@@ -59,7 +76,7 @@ def require_same_team(resource_team_id: int, user: User):
             detail="Access restricted to your team",
         )
     
-def require_task_ownership(task_owner_id: int, user: User):
+def require_task_ownership(task_owner_id: int, user: Principal):
     if user.role == UserRole.ADMIN:
         return
 
@@ -70,8 +87,8 @@ def require_task_ownership(task_owner_id: int, user: User):
         )
     
 def require_can_create_task(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     if current_user.role not in (
         UserRole.ADMIN,
         UserRole.MANAGER,
@@ -0,0 +1,21 @@
+import hashlib
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag over the given parts."""
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(),
+        digest_size=16,
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match check; uses weak comparison as RFC 9110 requires."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+
+def _timed(fn: Callable, *args) -> tuple[float, Any]:
+    # Runs in the worker; the start time tells us how long the job queued
+    return time.time(), fn(*args)
+
+
+class HashingPool:
+    """Runs bcrypt off the event loop in a bounded thread or process pool.
+
+    At most ``workers`` jobs run at once and at most ``max_queue`` more may
+    wait; beyond that callers get a 503 straight away instead of piling up.
+    """
+
+    def __init__(self, kind: str, workers: int, max_queue: int):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown hashing pool kind: {kind!r}")
+
+        self.kind = kind
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._pending = 0
+
+        self.completed = 0
+        self.rejected = 0
+        self.queue_seconds_total = 0.0
+        self.queue_seconds_max = 0.0
+        self.hash_seconds_total = 0.0
+        self.hash_seconds_max = 0.0
+
+    def _get_executor(self) -> Executor:
+        # Created lazily so importing the app never spawns workers
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="password-hash",
+                )
+        return self._executor
+
+    async def run(self, fn: Callable, *args) -> Any:
+        if self._pending >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+
+        self._pending += 1
+        submitted_at = time.time()
+        try:
+            started_at, result = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), _timed, fn, *args
+            )
+        finally:
+            self._pending -= 1
+        finished_at = time.time()
+
+        queued = max(started_at - submitted_at, 0.0)
+        hashed = finished_at - started_at
+        self.completed += 1
+        self.queue_seconds_total += queued
+        self.queue_seconds_max = max(self.queue_seconds_max, queued)
+        self.hash_seconds_total += hashed
+        self.hash_seconds_max = max(self.hash_seconds_max, hashed)
+
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_seconds_total": self.queue_seconds_total,
+            "queue_seconds_max": self.queue_seconds_max,
+            "hash_seconds_total": self.hash_seconds_total,
+            "hash_seconds_max": self.hash_seconds_max,
+        }
+
+
+password_pool = HashingPool(
+    kind=settings.password_hash_pool,
+    workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+)
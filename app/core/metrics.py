@@ -0,0 +1,205 @@
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Upper bounds, in seconds / statements. Fixed so a scrape is a plain dump.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the shape Prometheus exposes."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class RequestStats:
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+# Set by MetricsMiddleware for the duration of a request; SQLAlchemy's
+# async greenlets inherit the caller's context, so the cursor hooks see it
+current_request: ContextVar[RequestStats | None] = ContextVar(
+    "current_request", default=None
+)
+
+# Keyed by (method, route template); status codes only on the counter
+request_latency: dict[tuple[str, str], Histogram] = {}
+request_queries: dict[tuple[str, str], Histogram] = {}
+request_db_seconds: dict[tuple[str, str], Histogram] = {}
+requests_total: dict[tuple[str, str, int], int] = {}
+
+# Import and warm-up durations, filled in by the app lifespan
+startup_seconds: dict[str, float] = {}
+
+# Every statement, including ones outside a request (startup, scripts)
+db_queries_total = 0
+db_seconds_total = 0.0
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    global db_queries_total, db_seconds_total
+
+    elapsed = time.perf_counter() - context._metrics_started
+    db_queries_total += 1
+    db_seconds_total += elapsed
+
+    stats = current_request.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+
+def _observe(metric: dict, key: tuple, buckets: tuple, value: float) -> None:
+    histogram = metric.get(key)
+    if histogram is None:
+        histogram = metric[key] = Histogram(buckets)
+    histogram.observe(value)
+
+
+class MetricsMiddleware:
+    """Per-route latency, status, statement count and DB time.
+
+    Plain ASGI rather than BaseHTTPMiddleware: no extra task or body
+    buffering per request, so it can stay on in production.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request.reset(token)
+
+            # The route template, not the raw path, keeps label sets bounded
+            route = scope.get("route")
+            key = (scope["method"], getattr(route, "path", "unmatched"))
+
+            _observe(request_latency, key, LATENCY_BUCKETS, elapsed)
+            _observe(request_queries, key, QUERY_COUNT_BUCKETS, stats.queries)
+            _observe(request_db_seconds, key, LATENCY_BUCKETS, stats.db_seconds)
+            status_key = (*key, status_code)
+            requests_total[status_key] = requests_total.get(status_key, 0) + 1
+
+
+def _labels(**labels) -> str:
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _histogram_lines(name: str, help: str, metric: dict) -> Iterable[str]:
+    yield f"# HELP {name} {help}"
+    yield f"# TYPE {name} histogram"
+    for (method, route), histogram in metric.items():
+        cumulative = 0
+        for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+            cumulative += count
+            yield f"{name}_bucket{_labels(method=method, route=route, le=bound)} {cumulative}"
+        labels = _labels(method=method, route=route)
+        yield f"{name}_sum{labels} {histogram.sum}"
+        yield f"{name}_count{labels} {histogram.count}"
+
+
+def _gauge_lines(name: str, help: str, samples: Iterable[tuple[dict, float]]) -> Iterable[str]:
+    yield f"# HELP {name} {help}"
+    yield f"# TYPE {name} gauge"
+    for labels, value in samples:
+        yield f"{name}{_labels(**labels)} {value}"
+
+
+def _stats_lines(prefix: str, help: str, stats: dict[str, dict]) -> Iterable[str]:
+    """One gauge per numeric field of the stats() dicts the app exposes."""
+    fields: dict[str, list] = {}
+    for source, values in stats.items():
+        for field, value in values.items():
+            if isinstance(value, (int, float)):
+                fields.setdefault(field, []).append(({"source": source}, value))
+
+    for field, samples in fields.items():
+        yield from _gauge_lines(f"{prefix}_{field}", f"{help}: {field}", samples)
+
+
+def render(extra_stats: dict[str, tuple[str, dict[str, dict]]]) -> str:
+    """Prometheus text exposition format (version 0.0.4).
+
+    ``extra_stats`` maps a metric prefix to (help, {source: stats dict}).
+    """
+    lines = [
+        *_histogram_lines(
+            "taskflow_http_request_duration_seconds",
+            "Request latency by route",
+            request_latency,
+        ),
+        *_histogram_lines(
+            "taskflow_http_request_db_queries",
+            "SQL statements executed per request",
+            request_queries,
+        ),
+        *_histogram_lines(
+            "taskflow_http_request_db_seconds",
+            "Time spent in SQL statements per request",
+            request_db_seconds,
+        ),
+        "# HELP taskflow_http_requests_total Requests by route and status",
+        "# TYPE taskflow_http_requests_total counter",
+        *(
+            f"taskflow_http_requests_total{_labels(method=m, route=r, status=s)} {count}"
+            for (m, r, s), count in requests_total.items()
+        ),
+        "# HELP taskflow_db_queries_total SQL statements executed",
+        "# TYPE taskflow_db_queries_total counter",
+        f"taskflow_db_queries_total {db_queries_total}",
+        "# HELP taskflow_db_seconds_total Time spent in SQL statements",
+        "# TYPE taskflow_db_seconds_total counter",
+        f"taskflow_db_seconds_total {db_seconds_total}",
+    ]
+
+    for prefix, (help, stats) in extra_stats.items():
+        lines.extend(_stats_lines(prefix, help, stats))
+
+    return "\n".join(lines) + "\n"
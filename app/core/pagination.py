@@ -0,0 +1,59 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+
+def _encode(payload: dict) -> str:
+    data = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> dict:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor",
+    )
+
+
+def encode_cursor(created_at: datetime, task_id: UUID) -> str:
+    return _encode({"c": created_at.isoformat(), "i": str(task_id)})
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        payload = _decode(cursor)
+        return datetime.fromisoformat(payload["c"]), UUID(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise _invalid_cursor()
+
+
+def encode_watermark(change_xid: int, task_id: UUID) -> str:
+    return _encode({"x": change_xid, "i": str(task_id)})
+
+
+def decode_watermark(token: str) -> tuple[int, UUID]:
+    try:
+        payload = _decode(token)
+        return int(payload["x"]), UUID(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise _invalid_cursor()
+
+
+def encode_rank_cursor(rank: float, task_id: UUID) -> str:
+    return _encode({"r": rank, "i": str(task_id)})
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, UUID]:
+    try:
+        payload = _decode(cursor)
+        return float(payload["r"]), UUID(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise _invalid_cursor()
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.db.models.user import User
+from app.schemas.user import UserRole
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The authenticated caller: just the fields authorization needs."""
+
+    id: UUID
+    email: str
+    role: UserRole
+    team_id: UUID | None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=UserRole(user.role),
+            team_id=user.team_id,
+        )
+
+    @classmethod
+    def from_claims(cls, payload: dict) -> "Principal | None":
+        """Build from a claims token; None if the token carries no claims."""
+        if "role" not in payload:
+            return None
+
+        team_id = payload.get("team_id")
+        return cls(
+            id=UUID(payload["sub"]),
+            email=payload.get("email", ""),
+            role=UserRole(payload["role"]),
+            team_id=UUID(team_id) if team_id else None,
+        )
+
+    def to_claims(self) -> dict:
+        return {
+            "email": self.email,
+            "role": self.role.value,
+            "team_id": str(self.team_id) if self.team_id else None,
+        }
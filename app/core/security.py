@@ -8,6 +8,7 @@ from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 ALGORITHM = "HS256"
+REFRESH_TOKEN_TYPE = "refresh"
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -18,6 +19,7 @@ def verify_password(password: str, hashed_password: str) -> bool:
 def create_access_token(
     subject: str | int,
     expires_delta: timedelta | None = None,
+    claims: dict[str, Any] | None = None,
 ) -> str:
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -27,6 +29,7 @@ def create_access_token(
         )
 
     to_encode: dict[str, Any] = {
+        **(claims or {}),
         "exp": expire,
         "sub": str(subject),
     }
@@ -38,6 +41,14 @@ def create_access_token(
     )
     return encoded_jwt
 
+def create_refresh_token(subject: str | int) -> str:
+    """Only good for POST /auth/refresh; get_current_user rejects it."""
+    return create_access_token(
+        subject,
+        expires_delta=timedelta(minutes=settings.refresh_token_expire_minutes),
+        claims={"type": REFRESH_TOKEN_TYPE},
+    )
+
 def decode_access_token(token: str) -> Optional[dict]:
     try:
         payload = jwt.decode(
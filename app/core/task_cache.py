@@ -0,0 +1,15 @@
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# task id -> TaskRead payload, read through by GET /tasks/{task_id} and
+# filled from primary reads only. Writes in this process evict their
+# entries; other workers' copies expire within task_cache_ttl_seconds.
+task_cache = TTLCache(
+    maxsize=settings.task_cache_size,
+    ttl=settings.task_cache_ttl_seconds,
+)
+
+
+def evict_tasks(*task_ids) -> None:
+    for task_id in task_ids:
+        task_cache.pop(task_id)
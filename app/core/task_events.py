@@ -0,0 +1,247 @@
+"""Task change events: NOTIFY on write, one LISTEN connection per worker.
+
+A statement-level trigger on tasks (migration 372df003b800) NOTIFYs for
+every row a statement creates, updates, soft-deletes or archives, so
+every writer publishes: single and bulk endpoints, COPY imports and the
+archiver. Statements touching more than a thousand rows send one resync
+instead. Postgres delivers a NOTIFY only when its transaction commits, so
+rolled-back writes never emit. Each worker holds a single listening
+connection (opened when the first client subscribes) and hands every
+event to the subscribers allowed to see the task, before or after the
+change.
+
+Events carry ids only; clients fetch the task itself through
+GET /tasks/{task_id}, which is cached and ETag-aware.
+"""
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.core.principal import Principal
+from app.schemas.user import UserRole
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "task_events"
+
+# Runs on the listening connection, for every subscribed user at once
+CURRENT_PRINCIPALS = """
+    SELECT id, email, role::text AS role, team_id
+    FROM users
+    WHERE id = ANY($1::uuid[])
+"""
+
+
+@dataclass(eq=False)
+class Subscriber:
+    principal: Principal
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=100))
+    # Set when events were dropped; the client should refetch its lists
+    overflowed: bool = False
+    # Set when the principal is out of date; the stream should end
+    closed: bool = False
+
+    def offer(self, event: dict) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    def close(self) -> None:
+        self.closed = True
+        # Wake the stream; a full queue wakes it anyway
+        try:
+            self.queue.put_nowait({"op": "closed"})
+        except asyncio.QueueFull:
+            pass
+
+
+class TaskEventBroker:
+    """Fans NOTIFY payloads out to the subscribers that may see them.
+
+    Subscribers are indexed the way visible_tasks_query scopes reads
+    (ADMINs: everything, MANAGERs: by team, MEMBERs: by creator or
+    assignee), so an event costs O(interested subscribers), not
+    O(connected clients). Those principals are snapshots from connect
+    time, so every ``revalidate_seconds`` they are compared with users
+    and stale subscribers are closed.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        reconnect_seconds: float = 1.0,
+        revalidate_seconds: float = 60.0,
+    ):
+        self.dsn = dsn
+        self.reconnect_seconds = reconnect_seconds
+        self.revalidate_seconds = revalidate_seconds
+        self._admins: set[Subscriber] = set()
+        self._by_team: dict[UUID, set[Subscriber]] = {}
+        self._by_user: dict[UUID, set[Subscriber]] = {}
+        self._count = 0
+        self._listener: asyncio.Task | None = None
+
+        self.delivered = 0
+        self.reconnects = 0
+        self.revoked = 0
+
+    def _index(self, subscriber: Subscriber) -> set[Subscriber]:
+        principal = subscriber.principal
+        if principal.role == UserRole.ADMIN:
+            return self._admins
+        if principal.role == UserRole.MANAGER:
+            return self._by_team.setdefault(principal.team_id, set())
+        return self._by_user.setdefault(principal.id, set())
+
+    def subscribe(self, principal: Principal) -> Subscriber:
+        subscriber = Subscriber(principal)
+        self._index(subscriber).add(subscriber)
+        self._count += 1
+
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        group = self._index(subscriber)
+        group.discard(subscriber)
+        self._count -= 1
+
+        # Drop empty buckets so churn does not grow the indexes
+        principal = subscriber.principal
+        if not group and principal.role == UserRole.MANAGER:
+            self._by_team.pop(principal.team_id, None)
+        elif not group and principal.role == UserRole.MEMBER:
+            self._by_user.pop(principal.id, None)
+
+    def _dispatch(self, event: dict) -> None:
+        if event["op"] == "resync":
+            self._resync_all()
+            return
+
+        # The old audience learns the task left its view, the new one
+        # that it arrived
+        teams = {UUID(event["team_id"])}
+        if event["previous_team_id"]:
+            teams.add(UUID(event["previous_team_id"]))
+        users = {UUID(event["created_by_id"])}
+        for key in ("assigned_to_id", "previous_assigned_to_id"):
+            if event[key]:
+                users.add(UUID(event[key]))
+
+        targets = set(self._admins)
+        for team_id in teams:
+            targets.update(self._by_team.get(team_id, ()))
+        for user_id in users:
+            targets.update(self._by_user.get(user_id, ()))
+
+        for subscriber in targets:
+            subscriber.offer(event)
+        self.delivered += len(targets)
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            self._dispatch(json.loads(payload))
+        except (ValueError, KeyError):
+            logger.warning("Ignoring malformed task event: %r", payload)
+
+    def _subscribers(self):
+        for group in (self._admins, *self._by_team.values(), *self._by_user.values()):
+            yield from group
+
+    def _resync_all(self) -> None:
+        for subscriber in self._subscribers():
+            subscriber.offer({"op": "resync"})
+
+    async def _revalidate(self, connection: asyncpg.Connection) -> None:
+        subscribers = list(self._subscribers())
+        rows = await connection.fetch(
+            CURRENT_PRINCIPALS, list({s.principal.id for s in subscribers})
+        )
+        current = {
+            row["id"]: Principal(
+                id=row["id"],
+                email=row["email"],
+                role=UserRole(row["role"]),
+                team_id=row["team_id"],
+            )
+            for row in rows
+        }
+
+        # Deleted users, and anyone whose role, team or email changed
+        for subscriber in subscribers:
+            if current.get(subscriber.principal.id) != subscriber.principal:
+                subscriber.close()
+                self.revoked += 1
+
+    async def _listen(self) -> None:
+        # Runs while anyone is subscribed; reconnects when the link drops
+        missed = False
+        while self._count > 0:
+            connection = None
+            dropped = False
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                lost = asyncio.Event()
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(CHANNEL, self._on_notify)
+                if missed:
+                    # Listening again; whatever happened meanwhile is lost
+                    self._resync_all()
+                    missed = False
+
+                loop = asyncio.get_running_loop()
+                revalidate_at = loop.time() + self.revalidate_seconds
+                while self._count > 0 and not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), timeout=self.reconnect_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+                    if loop.time() >= revalidate_at and not lost.is_set():
+                        await self._revalidate(connection)
+                        revalidate_at = loop.time() + self.revalidate_seconds
+                dropped = lost.is_set()
+            except (OSError, asyncpg.PostgresError, asyncio.TimeoutError):
+                logger.warning("Task event listener failed; retrying", exc_info=True)
+                dropped = True
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            if dropped and self._count > 0:
+                missed = True
+                self.reconnects += 1
+                await asyncio.sleep(self.reconnect_seconds)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "subscribers": self._count,
+            "listening": int(self._listener is not None and not self._listener.done()),
+            "delivered": self.delivered,
+            "reconnects": self.reconnects,
+            "revoked": self.revoked,
+        }
+
+
+task_events = TaskEventBroker(
+    make_url(settings.database_url)
+    .set(drivername="postgresql")
+    .render_as_string(hide_password=False),
+    revalidate_seconds=settings.task_events_revalidate_seconds,
+)
@@ -0,0 +1,83 @@
+"""add task versions
+
+Revision ID: 2ec714539e0b
+Revises: 800821d133f0
+Create Date: 2026-10-18 19:58:13.690412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2ec714539e0b'
+down_revision: Union[str, Sequence[str], None] = '800821d133f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _bump(rows: str) -> str:
+    # Teams owning the changed tasks, plus the current teams of their
+    # creators and assignees (member lists span those), bumped in order
+    return f"""
+        INSERT INTO task_versions AS v (team_id, version)
+        SELECT team_id, 1
+        FROM (
+            SELECT r.team_id FROM {rows} r
+            UNION
+            SELECT u.team_id
+            FROM {rows} r
+            JOIN users u ON u.id IN (r.created_by_id, r.assigned_to_id)
+        ) teams
+        WHERE team_id IS NOT NULL
+        ORDER BY 1
+        ON CONFLICT (team_id) DO UPDATE SET version = v.version + 1;
+    """
+
+
+BUMP_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION task_versions_bump() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {_bump("new_rows")}
+    ELSIF TG_OP = 'DELETE' THEN
+        {_bump("old_rows")}
+    ELSE
+        {_bump("(SELECT * FROM old_rows UNION ALL SELECT * FROM new_rows)")}
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = {
+    "task_versions_insert": "AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows",
+    "task_versions_update": "AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "task_versions_delete": "AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_versions",
+        sa.Column("team_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("teams.id"), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+    op.execute(BUMP_FUNCTION)
+    for name, definition in TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {name} {definition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION task_versions_bump()"
+        )
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS task_versions_bump()")
+    op.drop_table("task_versions")
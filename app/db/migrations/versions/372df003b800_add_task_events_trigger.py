@@ -0,0 +1,98 @@
+"""add task events trigger
+
+Revision ID: 372df003b800
+Revises: cc77ff262f62
+Create Date: 2026-10-18 23:40:12.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '372df003b800'
+down_revision: Union[str, Sequence[str], None] = 'cc77ff262f62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# A statement touching more rows than this sends a single resync instead
+# of one event per row (COPY imports, large bulk writes)
+RESYNC_ROWS = 1000
+
+
+def _notify(op_name: str, rows: str, previous: str | None = None) -> str:
+    # Ids only, as the app's events always were; previous_* let the
+    # listener reach whoever could see the task before the change
+    return f"""
+        PERFORM pg_notify('task_events', json_build_object(
+            'op', {op_name},
+            'id', r.id,
+            'team_id', r.team_id,
+            'created_by_id', r.created_by_id,
+            'assigned_to_id', r.assigned_to_id,
+            'previous_team_id', {f"{previous}.team_id" if previous else "NULL"},
+            'previous_assigned_to_id', {f"{previous}.assigned_to_id" if previous else "NULL"}
+        )::text)
+        FROM {rows};
+    """
+
+
+def _too_many(rows: str) -> str:
+    return f"(SELECT count(*) FROM (SELECT FROM {rows} LIMIT {RESYNC_ROWS + 1}) s) > {RESYNC_ROWS}"
+
+
+NOTIFY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION task_events_notify() RETURNS trigger AS $$
+DECLARE
+    too_many boolean;
+BEGIN
+    -- Separate statements: a transition table exists only for its event
+    IF TG_OP = 'INSERT' THEN
+        too_many := {_too_many("new_rows")};
+    ELSE
+        too_many := {_too_many("old_rows")};
+    END IF;
+
+    IF too_many THEN
+        PERFORM pg_notify('task_events', '{{"op": "resync"}}');
+    ELSIF TG_OP = 'INSERT' THEN
+        {_notify("'created'", "new_rows r")}
+    ELSIF TG_OP = 'UPDATE' THEN
+        {_notify(
+            "CASE WHEN r.is_deleted AND NOT o.is_deleted THEN 'deleted' ELSE 'updated' END",
+            "new_rows r JOIN old_rows o USING (id)",
+            previous="o",
+        )}
+    ELSE
+        -- Archival; soft-deleted rows were announced when deleted
+        {_notify("'archived'", "old_rows r WHERE NOT r.is_deleted")}
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = {
+    "task_events_insert": "AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows",
+    "task_events_update": "AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "task_events_delete": "AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    # NOTIFY from the database, so every writer publishes: the API, bulk
+    # statements, COPY imports and the archiver alike
+    op.execute(NOTIFY_FUNCTION)
+    for name, definition in TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {name} {definition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION task_events_notify()"
+        )
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS task_events_notify()")
@@ -0,0 +1,119 @@
+"""add task counts
+
+Revision ID: 38e8f56e635e
+Revises: f816cee0c6d5
+Create Date: 2026-10-18 19:32:07.514920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '38e8f56e635e'
+down_revision: Union[str, Sequence[str], None] = 'f816cee0c6d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+task_status_enum = postgresql.ENUM(
+    "OPEN",
+    "IN_PROGRESS",
+    "DONE",
+    name="taskstatus",
+    create_type=False,
+)
+
+UNASSIGNED = "'00000000-0000-0000-0000-000000000000'::uuid"
+
+# Statement-level triggers see every affected row through transition
+# tables, so a 5,000-row bulk insert costs one counter upsert per group
+# rather than one per row. Keys are upserted in order to avoid deadlocks
+# between concurrent writers.
+REFRESH_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION task_counts_refresh() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO task_counts AS c (team_id, status, assigned_to_id, count)
+        SELECT team_id, status, COALESCE(assigned_to_id, {UNASSIGNED}), count(*)
+        FROM new_rows
+        WHERE NOT is_deleted
+        GROUP BY 1, 2, 3
+        ORDER BY 1, 2, 3
+        ON CONFLICT (team_id, status, assigned_to_id)
+        DO UPDATE SET count = c.count + EXCLUDED.count;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO task_counts AS c (team_id, status, assigned_to_id, count)
+        SELECT team_id, status, COALESCE(assigned_to_id, {UNASSIGNED}), -count(*)
+        FROM old_rows
+        WHERE NOT is_deleted
+        GROUP BY 1, 2, 3
+        ORDER BY 1, 2, 3
+        ON CONFLICT (team_id, status, assigned_to_id)
+        DO UPDATE SET count = c.count + EXCLUDED.count;
+
+    ELSE
+        INSERT INTO task_counts AS c (team_id, status, assigned_to_id, count)
+        SELECT team_id, status, assignee, sum(delta)
+        FROM (
+            SELECT team_id, status, COALESCE(assigned_to_id, {UNASSIGNED}) AS assignee, -1 AS delta
+            FROM old_rows
+            WHERE NOT is_deleted
+            UNION ALL
+            SELECT team_id, status, COALESCE(assigned_to_id, {UNASSIGNED}), 1
+            FROM new_rows
+            WHERE NOT is_deleted
+        ) deltas
+        GROUP BY 1, 2, 3
+        HAVING sum(delta) <> 0
+        ORDER BY 1, 2, 3
+        ON CONFLICT (team_id, status, assigned_to_id)
+        DO UPDATE SET count = c.count + EXCLUDED.count;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = {
+    "task_counts_insert": "AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows",
+    "task_counts_update": "AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "task_counts_delete": "AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_counts",
+        sa.Column("team_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("teams.id"), primary_key=True),
+        sa.Column("status", task_status_enum, primary_key=True),
+        sa.Column("assigned_to_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+    op.execute(REFRESH_FUNCTION)
+    for name, definition in TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {name} {definition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION task_counts_refresh()"
+        )
+
+    # Backfill; the triggers keep it current from here on
+    op.execute(f"""
+        INSERT INTO task_counts (team_id, status, assigned_to_id, count)
+        SELECT team_id, status, COALESCE(assigned_to_id, {UNASSIGNED}), count(*)
+        FROM tasks
+        WHERE NOT is_deleted
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS task_counts_refresh()")
+    op.drop_table("task_counts")
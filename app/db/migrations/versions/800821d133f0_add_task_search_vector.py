@@ -0,0 +1,59 @@
+"""add task search vector
+
+Revision ID: 800821d133f0
+Revises: 38e8f56e635e
+Create Date: 2026-10-18 19:45:51.208377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '800821d133f0'
+down_revision: Union[str, Sequence[str], None] = '38e8f56e635e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Adding a stored generated column rewrites tasks; schedule it in a
+    # maintenance window on large installs
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR, persisted=True),
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_live_search_vector",
+            "tasks",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_live_search_vector",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("tasks", "search_vector")
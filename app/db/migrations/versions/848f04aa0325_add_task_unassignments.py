@@ -0,0 +1,68 @@
+"""add task unassignments
+
+Revision ID: 848f04aa0325
+Revises: 929b271fcb04
+Create Date: 2026-10-19 00:58:31.227604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '848f04aa0325'
+down_revision: Union[str, Sequence[str], None] = '929b271fcb04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Reassignment is the only way a MEMBER loses sight of a task: team and
+# creator never change. One statement-level trigger logs every row a
+# statement takes away from its previous, non-creator assignee.
+LOG_FUNCTION = """
+CREATE OR REPLACE FUNCTION task_unassignments_log() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO task_unassignments (user_id, task_id, team_id)
+    SELECT o.assigned_to_id, o.id, o.team_id
+    FROM old_rows o
+    JOIN new_rows n USING (id)
+    WHERE o.assigned_to_id IS NOT NULL
+      AND o.assigned_to_id IS DISTINCT FROM n.assigned_to_id
+      AND o.assigned_to_id <> o.created_by_id
+    ON CONFLICT DO NOTHING;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_unassignments",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "change_xid",
+            sa.BigInteger(),
+            primary_key=True,
+            server_default=sa.text("(pg_current_xact_id()::text::bigint)"),
+        ),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("team_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("unassigned_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+    op.execute(LOG_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER task_unassignments_log "
+        "AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION task_unassignments_log()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS task_unassignments_log ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS task_unassignments_log()")
+    op.drop_table("task_unassignments")
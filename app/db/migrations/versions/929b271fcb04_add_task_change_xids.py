@@ -0,0 +1,104 @@
+"""add task change xids
+
+Revision ID: 929b271fcb04
+Revises: 372df003b800
+Create Date: 2026-10-19 00:12:44.903115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '929b271fcb04'
+down_revision: Union[str, Sequence[str], None] = '372df003b800'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The writing transaction's id. Unlike a timestamp or a sequence value it
+# orders rows against the snapshot horizon: once it is below the xmin of
+# a snapshot, the write has committed (or rolled back).
+CURRENT_XID = "pg_current_xact_id()::text::bigint"
+
+# Inserts take the column default; updates are restamped here
+STAMP_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION tasks_stamp_change_xid() RETURNS trigger AS $$
+BEGIN
+    NEW.change_xid := {CURRENT_XID};
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+COLUMNS = {
+    "tasks": "change_xid",
+    "tasks_archive": "archived_xid",
+}
+
+# GET /tasks/changes walks (change_xid, id) from a watermark, replacing
+# the (updated_at, id) and (archived_at, id) indexes
+NEW_INDEXES = {
+    "ix_tasks_team_change_xid_id": ("tasks", ["team_id", "change_xid", "id"]),
+    "ix_tasks_change_xid_id": ("tasks", ["change_xid", "id"]),
+    "ix_tasks_archive_team_archived_xid_id": ("tasks_archive", ["team_id", "archived_xid", "id"]),
+    "ix_tasks_archive_archived_xid_id": ("tasks_archive", ["archived_xid", "id"]),
+}
+
+OLD_INDEXES = {
+    "ix_tasks_team_updated_at_id": ("tasks", ["team_id", "updated_at", "id"]),
+    "ix_tasks_updated_at_id": ("tasks", ["updated_at", "id"]),
+    "ix_tasks_archive_team_archived_at_id": ("tasks_archive", ["team_id", "archived_at", "id"]),
+    "ix_tasks_archive_archived_at_id": ("tasks_archive", ["archived_at", "id"]),
+}
+
+
+def _create_indexes(indexes: dict) -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in indexes.items():
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def _drop_indexes(indexes: dict) -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, _) in indexes.items():
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS.items():
+        # A constant default is metadata only; existing rows sort first.
+        # The real default is set afterwards so no rewrite is needed.
+        op.add_column(table, sa.Column(column, sa.BigInteger(), nullable=False, server_default="0"))
+        op.alter_column(table, column, server_default=sa.text(f"({CURRENT_XID})"))
+
+    op.execute(STAMP_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER tasks_stamp_change_xid BEFORE UPDATE ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION tasks_stamp_change_xid()"
+    )
+
+    _create_indexes(NEW_INDEXES)
+    _drop_indexes(OLD_INDEXES)
+
+
+def downgrade() -> None:
+    _create_indexes(OLD_INDEXES)
+    _drop_indexes(NEW_INDEXES)
+
+    op.execute("DROP TRIGGER IF EXISTS tasks_stamp_change_xid ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS tasks_stamp_change_xid()")
+    for table, column in COLUMNS.items():
+        op.drop_column(table, column)
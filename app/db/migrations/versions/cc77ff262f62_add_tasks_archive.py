@@ -0,0 +1,101 @@
+"""add tasks archive
+
+Revision ID: cc77ff262f62
+Revises: ec05eb2d6454
+Create Date: 2026-10-18 22:15:37.208841
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cc77ff262f62'
+down_revision: Union[str, Sequence[str], None] = 'ec05eb2d6454'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+task_status_enum = postgresql.ENUM(
+    "OPEN",
+    "IN_PROGRESS",
+    "DONE",
+    name="taskstatus",
+    create_type=False,
+)
+
+ARCHIVE_INDEXES = {
+    # GET /tasks/archive: same shapes as the live list indexes
+    "ix_tasks_archive_live_team_created_at_id": ["team_id", "created_at", "id"],
+    "ix_tasks_archive_live_created_by_created_at_id": ["created_by_id", "created_at", "id"],
+    "ix_tasks_archive_live_assigned_to_created_at_id": ["assigned_to_id", "created_at", "id"],
+    "ix_tasks_archive_live_created_at_id": ["created_at", "id"],
+}
+
+ARCHIVED_INDEXES = {
+    # GET /tasks/changes: tasks archived since a watermark
+    "ix_tasks_archive_team_archived_at_id": ["team_id", "archived_at", "id"],
+    "ix_tasks_archive_archived_at_id": ["archived_at", "id"],
+}
+
+# What each archival pass walks, oldest first
+ARCHIVABLE_INDEXES = {
+    "ix_tasks_deleted_updated_at_id": "is_deleted = true",
+    "ix_tasks_done_updated_at_id": "status = 'DONE' AND is_deleted = false",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tasks_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", task_status_enum, nullable=False),
+        sa.Column("created_by_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("assigned_to_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("team_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("teams.id"), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=False), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=False), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=False), nullable=False, server_default=sa.func.now()),
+    )
+    for name, columns in ARCHIVE_INDEXES.items():
+        op.create_index(name, "tasks_archive", columns, postgresql_where=sa.text("is_deleted = false"))
+    for name, columns in ARCHIVED_INDEXES.items():
+        op.create_index(name, "tasks_archive", columns)
+
+    op.create_table(
+        "task_archive_progress",
+        sa.Column("name", sa.String(32), primary_key=True),
+        sa.Column("updated_at", sa.DateTime(timezone=False), nullable=False),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+    )
+
+    # tasks is live; build its indexes without blocking writes
+    with op.get_context().autocommit_block():
+        for name, where in ARCHIVABLE_INDEXES.items():
+            op.create_index(
+                name,
+                "tasks",
+                ["updated_at", "id"],
+                postgresql_where=sa.text(where),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in ARCHIVABLE_INDEXES:
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    op.drop_table("task_archive_progress")
+    op.drop_table("tasks_archive")
@@ -0,0 +1,48 @@
+"""archive timestamps with time zone
+
+Revision ID: e60b51d076bb
+Revises: 848f04aa0325
+Create Date: 2026-10-19 01:34:50.117342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e60b51d076bb'
+down_revision: Union[str, Sequence[str], None] = '848f04aa0325'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# timestamptz, like tasks: the archiver copies tasks' values verbatim and
+# asyncpg will not bind the aware datetimes it reads back to a timestamp
+# column. Values so far were written in UTC.
+COLUMNS = {
+    "tasks_archive": ("created_at", "updated_at", "archived_at"),
+    "task_archive_progress": ("updated_at",),
+}
+
+
+def upgrade() -> None:
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+
+def downgrade() -> None:
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=False),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
@@ -0,0 +1,49 @@
+"""add task changes indexes
+
+Revision ID: ec05eb2d6454
+Revises: 2ec714539e0b
+Create Date: 2026-10-18 21:40:12.504117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ec05eb2d6454'
+down_revision: Union[str, Sequence[str], None] = '2ec714539e0b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# GET /tasks/changes walks (updated_at, id) from a watermark. Not partial:
+# deleted rows are returned as tombstones.
+TASK_INDEXES = {
+    # MANAGER, MEMBER, and ADMIN with a team_id
+    "ix_tasks_team_updated_at_id": ["team_id", "updated_at", "id"],
+    # ADMIN across all teams
+    "ix_tasks_updated_at_id": ["updated_at", "id"],
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in TASK_INDEXES.items():
+            op.create_index(
+                name,
+                "tasks",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in TASK_INDEXES:
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,59 @@
+"""add task visibility indexes
+
+Revision ID: f816cee0c6d5
+Revises: 35734de94e9c
+Create Date: 2026-10-18 19:10:42.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f816cee0c6d5'
+down_revision: Union[str, Sequence[str], None] = '35734de94e9c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# One index per list_tasks query shape. Every list is ordered by
+# (created_at, id) and only ever reads live rows, so each index ends in
+# those columns and is partial on is_deleted = false.
+TASK_INDEXES = {
+    # ADMIN
+    "ix_tasks_live_created_at_id": ["created_at", "id"],
+    "ix_tasks_live_status_created_at_id": ["status", "created_at", "id"],
+    # MANAGER
+    "ix_tasks_live_team_created_at_id": ["team_id", "created_at", "id"],
+    "ix_tasks_live_team_status_created_at_id": ["team_id", "status", "created_at", "id"],
+    # MEMBER (one index per side of the OR) and assignee filter
+    "ix_tasks_live_created_by_created_at_id": ["created_by_id", "created_at", "id"],
+    "ix_tasks_live_assigned_to_created_at_id": ["assigned_to_id", "created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, but keeps the table
+    # writable while the indexes build.
+    with op.get_context().autocommit_block():
+        for name, columns in TASK_INDEXES.items():
+            op.create_index(
+                name,
+                "tasks",
+                columns,
+                postgresql_where=sa.text("is_deleted = false"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in TASK_INDEXES:
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
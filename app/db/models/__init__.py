@@ -1,3 +1,7 @@
 from app.db.models.user import User
 from app.db.models.team import Team
 from app.db.models.task import Task
+from app.db.models.task_count import TaskCount
+from app.db.models.task_version import TaskVersion
+from app.db.models.task_archive import TaskArchive, TaskArchiveProgress
+from app.db.models.task_unassignment import TaskUnassignment
@@ -2,17 +2,21 @@ import uuid
 from enum import Enum
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     String,
     Text,
     ForeignKey,
     Enum as SqlEnum,
     Boolean,
+    Computed,
     DateTime,
+    Index,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.db.base import Base
 
@@ -23,8 +27,33 @@ class TaskStatus(str, Enum):
     DONE = "DONE"
 
 
+LIVE_TASKS = text("is_deleted = false")
+# Rows scripts.archive_tasks moves to tasks_archive once old enough
+DELETED_TASKS = text("is_deleted = true")
+DONE_TASKS = text("status = 'DONE' AND is_deleted = false")
+
+# The writing transaction's id; a trigger restamps change_xid on update
+CURRENT_XID = text("(pg_current_xact_id()::text::bigint)")
+
+# Text search configuration used for search_vector and for queries
+SEARCH_CONFIG = "english"
+
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_live_created_at_id", "created_at", "id", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_status_created_at_id", "status", "created_at", "id", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_team_created_at_id", "team_id", "created_at", "id", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_team_status_created_at_id", "team_id", "status", "created_at", "id", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_created_by_created_at_id", "created_by_id", "created_at", "id", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_live_assigned_to_created_at_id", "assigned_to_id", "created_at", "id", postgresql_where=LIVE_TASKS),
+        Index("ix_tasks_team_change_xid_id", "team_id", "change_xid", "id"),
+        Index("ix_tasks_change_xid_id", "change_xid", "id"),
+        Index("ix_tasks_deleted_updated_at_id", "updated_at", "id", postgresql_where=DELETED_TASKS),
+        Index("ix_tasks_done_updated_at_id", "updated_at", "id", postgresql_where=DONE_TASKS),
+        Index("ix_tasks_live_search_vector", "search_vector", postgresql_using="gin", postgresql_where=LIVE_TASKS),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -48,13 +77,28 @@ class Task(Base):
     is_deleted = Column(Boolean, nullable=False, server_default="false")
 
     # Timestamps
-    created_at = Column(DateTime(timezone=False), nullable=False, server_default=func.now())
+    # timestamptz in the database (see the soft delete migration)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
-        DateTime(timezone=False),
+        DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
         onupdate=func.now(),
     )
+    # Orders GET /tasks/changes by commit, see task_changes_query
+    change_xid = Column(BigInteger, nullable=False, server_default=CURRENT_XID)
+
+    # Full-text search; generated by Postgres, deferred so normal loads skip it
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
 
     # Relationships
     created_by = relationship("User", foreign_keys=[created_by_id])
@@ -0,0 +1,68 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    String,
+    Text,
+    ForeignKey,
+    Enum as SqlEnum,
+    Boolean,
+    DateTime,
+    Index,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base import Base
+from app.db.models.task import CURRENT_XID, TaskStatus
+
+ARCHIVED_LIVE = text("is_deleted = false")
+
+
+class TaskArchive(Base):
+    """Cold tasks moved out of ``tasks`` by scripts.archive_tasks.
+
+    Same columns as Task (the search vector is dropped), plus when the row
+    was archived. Rows only ever arrive here; nothing updates them.
+    """
+
+    __tablename__ = "tasks_archive"
+    __table_args__ = (
+        # GET /tasks/archive, by role, newest first
+        Index("ix_tasks_archive_live_team_created_at_id", "team_id", "created_at", "id", postgresql_where=ARCHIVED_LIVE),
+        Index("ix_tasks_archive_live_created_by_created_at_id", "created_by_id", "created_at", "id", postgresql_where=ARCHIVED_LIVE),
+        Index("ix_tasks_archive_live_assigned_to_created_at_id", "assigned_to_id", "created_at", "id", postgresql_where=ARCHIVED_LIVE),
+        Index("ix_tasks_archive_live_created_at_id", "created_at", "id", postgresql_where=ARCHIVED_LIVE),
+        # GET /tasks/changes reports archived tasks as removed
+        Index("ix_tasks_archive_team_archived_xid_id", "team_id", "archived_xid", "id"),
+        Index("ix_tasks_archive_archived_xid_id", "archived_xid", "id"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    status = Column(SqlEnum(TaskStatus, name="taskstatus"), nullable=False)
+
+    created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    assigned_to_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id"), nullable=False)
+
+    is_deleted = Column(Boolean, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    archived_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # The archiving transaction's id, like Task.change_xid
+    archived_xid = Column(BigInteger, nullable=False, server_default=CURRENT_XID)
+
+
+class TaskArchiveProgress(Base):
+    """Where an interrupted archival pass resumes: the (updated_at, id) of
+    the last task it moved. Cleared when the pass catches up."""
+
+    __tablename__ = "task_archive_progress"
+
+    name = Column(String(32), primary_key=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    task_id = Column(UUID(as_uuid=True), nullable=False)
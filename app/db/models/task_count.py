@@ -0,0 +1,25 @@
+import uuid
+
+from sqlalchemy import BigInteger, Column, Enum as SqlEnum, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base import Base
+from app.db.models.task import TaskStatus
+
+# Stands in for "unassigned" so assigned_to_id can be part of the key
+UNASSIGNED = uuid.UUID(int=0)
+
+
+class TaskCount(Base):
+    """Live task count per (team, status, assignee).
+
+    Maintained by statement-level triggers on tasks, in the same
+    transaction as the write; see app.db.task_counts for reconciliation.
+    """
+
+    __tablename__ = "task_counts"
+
+    team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id"), primary_key=True)
+    status = Column(SqlEnum(TaskStatus, name="taskstatus"), primary_key=True)
+    assigned_to_id = Column(UUID(as_uuid=True), primary_key=True)
+    count = Column(BigInteger, nullable=False, server_default="0")
@@ -0,0 +1,25 @@
+from sqlalchemy import BigInteger, Column, DateTime, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base import Base
+from app.db.models.task import CURRENT_XID
+
+
+class TaskUnassignment(Base):
+    """A task reassigned away from a user who did not create it, logged by
+    a trigger on tasks.
+
+    The user can no longer see the task, so GET /tasks/changes reports it
+    to them as removed. No foreign keys: the task may since have been
+    archived.
+    """
+
+    __tablename__ = "task_unassignments"
+
+    # Also the index the MEMBER changes feed walks
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    change_xid = Column(BigInteger, primary_key=True, server_default=CURRENT_XID)
+    task_id = Column(UUID(as_uuid=True), primary_key=True)
+
+    team_id = Column(UUID(as_uuid=True), nullable=False)
+    unassigned_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
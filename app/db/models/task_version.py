@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, Column, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base import Base
+
+
+class TaskVersion(Base):
+    """Per-team change counter for tasks, bumped by a trigger on every write.
+
+    A team is bumped when one of its tasks changes, and also when a task
+    created by or assigned to one of its users changes.
+    """
+
+    __tablename__ = "task_versions"
+
+    team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id"), primary_key=True)
+    version = Column(BigInteger, nullable=False, server_default="0")
@@ -0,0 +1,127 @@
+"""Hot statements, built once with bound parameters.
+
+Building a select() and deriving its cache key on every request costs more
+CPU than the compiled-cache lookup it feeds. A statement built once at
+import keeps its cache key, so executing it goes straight to the cached
+compiled form. Its SQL text never changes either, so asyncpg's prepared
+statement cache (db_prepared_statement_cache_size) reuses the server-side
+statement on each pooled connection.
+
+Statements whose shape depends on the request (which filters, which role)
+are built once per shape and memoized.
+
+    await db.execute(USER_BY_ID, {"user_id": user_id})
+"""
+from functools import cache
+
+from sqlalchemy import bindparam, false, func, insert, or_, select, tuple_, update
+
+from app.db.models.task import Task
+from app.db.models.user import User
+from app.schemas.user import UserRole
+
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+
+# Existence check for "user_id is a member of team_id"
+TEAM_MEMBER_ID = select(User.id).where(
+    User.id == bindparam("user_id"),
+    User.team_id == bindparam("team_id"),
+)
+
+# TaskResponse's fields, in order. List reads select just these into
+# row tuples instead of hydrating Task entities.
+TASK_RESPONSE_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.created_by_id,
+    Task.assigned_to_id,
+    Task.team_id,
+    Task.created_at,
+)
+
+# INSERT ... RETURNING the whole row: no refresh SELECT after commit
+INSERT_TASK = insert(Task).returning(Task)
+
+
+def _update_task(role: UserRole):
+    # Fields left as NULL keep their value, so one statement covers every
+    # combination of fields in a TaskUpdate. Parameters: task_id, new_title,
+    # new_description, new_status, assignee_id and (unless ADMIN) scope_team_id;
+    # names differ from the columns, which update() reserves.
+    assignee_id = bindparam("assignee_id", type_=Task.assigned_to_id.type)
+
+    assignee = select(User.id).where(User.id == assignee_id)
+    if role != UserRole.ADMIN:
+        assignee = assignee.where(User.team_id == bindparam("scope_team_id"))
+
+    stmt = (
+        update(Task)
+        .where(
+            Task.id == bindparam("task_id"),
+            Task.is_deleted == false(),
+            or_(assignee_id.is_(None), assignee.exists()),
+        )
+        .values(
+            title=func.coalesce(bindparam("new_title", type_=Task.title.type), Task.title),
+            description=func.coalesce(
+                bindparam("new_description", type_=Task.description.type), Task.description
+            ),
+            status=func.coalesce(bindparam("new_status", type_=Task.status.type), Task.status),
+            assigned_to_id=func.coalesce(assignee_id, Task.assigned_to_id),
+            updated_at=func.now(),
+        )
+        .returning(Task)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+
+    # MANAGER can change only their team tasks
+    if role == UserRole.MANAGER:
+        stmt = stmt.where(Task.team_id == bindparam("scope_team_id"))
+
+    return stmt
+
+
+UPDATE_TASK = {role: _update_task(role) for role in UserRole}
+
+
+@cache
+def task_list(role: UserRole, status: bool, assignee: bool, after: bool):
+    """list_tasks' statement for one shape of request.
+
+    Parameters: team_id / user_id (by role), status, assignee_id,
+    after_created_at + after_id or skip, and limit.
+    """
+    query = select(*TASK_RESPONSE_COLUMNS).where(Task.is_deleted == false())
+
+    # Role-based visibility, as in visible_tasks_query
+    if role == UserRole.MANAGER:
+        query = query.where(Task.team_id == bindparam("team_id"))
+    elif role == UserRole.MEMBER:
+        user_id = bindparam("user_id", type_=Task.created_by_id.type)
+        query = query.where(
+            or_(Task.created_by_id == user_id, Task.assigned_to_id == user_id)
+        )
+
+    # Filters
+    if status:
+        query = query.where(Task.status == bindparam("status"))
+
+    if assignee:
+        query = query.where(Task.assigned_to_id == bindparam("assignee_id"))
+
+    query = query.order_by(Task.created_at.desc(), Task.id.desc())
+
+    if after:
+        query = query.where(
+            tuple_(Task.created_at, Task.id)
+            < tuple_(
+                bindparam("after_created_at", type_=Task.created_at.type),
+                bindparam("after_id", type_=Task.id.type),
+            )
+        )
+    else:
+        query = query.offset(bindparam("skip"))
+
+    return query.limit(bindparam("limit"))
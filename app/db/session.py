@@ -1,13 +1,38 @@
+import asyncio
+import logging
+import math
+import time
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.db.pool import InstrumentedPool
+
+logger = logging.getLogger(__name__)
+
+
+def _create_engine(url: str):
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        },
+    )
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=False,
-    future=True,
-)
+
+engine = _create_engine(settings.database_url)
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
@@ -15,6 +40,123 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
-async def get_db():
-    async with AsyncSessionLocal() as session:
+# Optional read replica for GET endpoints (see get_read_db)
+replica_engine = (
+    _create_engine(settings.database_replica_url)
+    if settings.database_replica_url
+    else None
+)
+
+ReplicaSessionLocal = (
+    sessionmaker(bind=replica_engine, class_=AsyncSession, expire_on_commit=False)
+    if replica_engine is not None
+    else None
+)
+
+async def dispose_engines() -> None:
+    await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+
+
+def pool_stats() -> dict[str, dict]:
+    stats = {"primary": engine.pool.stats()}
+    if replica_engine is not None:
+        stats["replica"] = replica_engine.pool.stats()
+    return stats
+
+
+# Read-your-writes: a client that just committed a write reads from the
+# primary until the replica has had time to catch up. The write time
+# travels with the client in a cookie, so whichever worker serves its
+# next read honours it.
+WROTE_AT_COOKIE = "taskflow_wrote_at"
+
+# When the replica fails, reads use the primary until this time
+_replica_down_until = 0.0
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_write(session):
+    request = session.info.get("request")
+    if request is not None:
+        request.state.wrote_at = time.time()
+
+
+class ReadYourWritesMiddleware:
+    """Sets the wrote-at cookie on responses to requests that committed."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            wrote_at = scope.get("state", {}).get("wrote_at")
+            if message["type"] == "http.response.start" and wrote_at:
+                cookie = (
+                    f"{WROTE_AT_COOKIE}={wrote_at:.3f}; "
+                    f"Max-Age={math.ceil(settings.read_your_writes_seconds)}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"set-cookie", cookie.encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def wrote_recently(request: Request) -> bool:
+    try:
+        wrote_at = float(request.cookies.get(WROTE_AT_COOKIE, 0))
+    except ValueError:
+        return False
+    return time.time() - wrote_at < settings.read_your_writes_seconds
+
+
+async def get_db(request: Request):
+    async with AsyncSessionLocal(info={"request": request}) as session:
+        yield session
+
+
+async def get_read_db(request: Request):
+    """Session for read-only endpoints: the replica when it is safe to use.
+
+    Falls back to the primary when no replica is configured, when this
+    client wrote recently, or when the replica cannot be reached. The
+    session's info says which: "replica" for replica reads, "pinned"
+    for a recent writer's.
+    """
+    global _replica_down_until
+
+    pinned = wrote_recently(request)
+    use_replica = (
+        ReplicaSessionLocal is not None
+        and time.time() >= _replica_down_until
+        and not pinned
+    )
+
+    if use_replica:
+        async with ReplicaSessionLocal(info={"replica": True}) as session:
+            try:
+                # Connect now so a dead replica is noticed here, where we
+                # can still fall back, rather than inside the endpoint
+                await session.connection()
+            except (OSError, asyncio.TimeoutError, DBAPIError):
+                logger.warning(
+                    "Read replica unavailable; using primary for %ss",
+                    settings.replica_retry_seconds,
+                    exc_info=True,
+                )
+                _replica_down_until = time.time() + settings.replica_retry_seconds
+            else:
+                yield session
+                return
+
+    async with AsyncSessionLocal(info={"pinned": pinned}) as session:
         yield session
@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.task import DELETED_TASKS, DONE_TASKS
+
+NIL = UUID(int=0)
+# Before any task; aware, like the timestamptz values it is compared with
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Each pass walks its partial index on tasks (updated_at, id) oldest first.
+# The predicates must match the index definitions for the planner to use
+# them.
+PASSES = {
+    "deleted": DELETED_TASKS.text,
+    "done": DONE_TASKS.text,
+}
+
+TASK_COLUMNS = (
+    "id", "title", "description", "status", "created_by_id",
+    "assigned_to_id", "team_id", "is_deleted", "created_at", "updated_at",
+)
+
+
+def _move_batch(predicate: str):
+    columns = ", ".join(TASK_COLUMNS)
+    # Copy and delete in one statement, so a batch is all or nothing.
+    # SKIP LOCKED leaves rows a request is writing to the next run. An id
+    # already in the archive fails the batch rather than drop the live row.
+    return text(f"""
+        WITH batch AS (
+            SELECT id
+            FROM tasks
+            WHERE {predicate}
+              AND updated_at < now() - make_interval(days => :older_than_days)
+              AND (updated_at, id) > (:after_updated_at, :after_id)
+              AND (CAST(:team_id AS uuid) IS NULL OR team_id = :team_id)
+            ORDER BY updated_at, id
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        ), moved AS (
+            DELETE FROM tasks t
+            USING batch b
+            WHERE t.id = b.id
+            RETURNING {", ".join(f"t.{column}" for column in TASK_COLUMNS)}
+        ), archived AS (
+            INSERT INTO tasks_archive ({columns})
+            SELECT {columns} FROM moved
+        )
+        SELECT updated_at, id, (SELECT count(*) FROM moved) AS moved
+        FROM moved
+        ORDER BY updated_at DESC, id DESC
+        LIMIT 1
+    """)
+
+
+MOVE_BATCH = {name: _move_batch(predicate) for name, predicate in PASSES.items()}
+
+LOAD_PROGRESS = text("""
+    SELECT updated_at, task_id FROM task_archive_progress WHERE name = :name
+""")
+
+SAVE_PROGRESS = text("""
+    INSERT INTO task_archive_progress (name, updated_at, task_id)
+    VALUES (:name, :updated_at, :task_id)
+    ON CONFLICT (name)
+    DO UPDATE SET updated_at = EXCLUDED.updated_at, task_id = EXCLUDED.task_id
+""")
+
+CLEAR_PROGRESS = text("DELETE FROM task_archive_progress WHERE name = :name")
+
+
+async def archive_pass(
+    db: AsyncSession,
+    name: str,
+    older_than_days: int,
+    batch_size: int,
+    pause: float,
+    max_batches: int | None = None,
+    team_id: UUID | None = None,
+    progress_name: str | None = None,
+) -> int:
+    """Move one kind of cold task to tasks_archive; returns how many moved.
+
+    One short transaction per batch, which also records how far the pass
+    got, so an interrupted run picks up where it stopped. A pass that
+    catches up clears its progress: the next run starts from the oldest
+    row again and finds rows it skipped while they were locked.
+
+    ``team_id`` limits the pass to one team's tasks. Progress is saved
+    under ``progress_name`` (the pass name by default); a scoped run
+    should use its own, so it neither resumes from nor clears the
+    progress of a full run.
+    """
+    progress_name = progress_name or name
+    result = await db.execute(LOAD_PROGRESS, {"name": progress_name})
+    row = result.one_or_none()
+    after = (row.updated_at, row.task_id) if row else (EPOCH, NIL)
+    await db.commit()
+
+    moved = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        result = await db.execute(
+            MOVE_BATCH[name],
+            {
+                "older_than_days": older_than_days,
+                "after_updated_at": after[0],
+                "after_id": after[1],
+                "batch_size": batch_size,
+                "team_id": team_id,
+            },
+        )
+        last = result.one_or_none()
+
+        if last is None:
+            await db.execute(CLEAR_PROGRESS, {"name": progress_name})
+            await db.commit()
+            break
+
+        await db.execute(
+            SAVE_PROGRESS,
+            {"name": progress_name, "updated_at": last.updated_at, "task_id": last.id},
+        )
+        await db.commit()
+
+        moved += last.moved
+        batches += 1
+        after = (last.updated_at, last.id)
+
+        # Throttle: leave the primary, vacuum and replicas room to keep up
+        await asyncio.sleep(pause)
+
+    return moved
@@ -0,0 +1,63 @@
+from uuid import UUID
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.team import Team
+
+# Recount one team's live tasks and repair the counters that drifted.
+# Counters for groups that no longer have tasks are zeroed, not deleted.
+REPAIR_TEAM = text("""
+    WITH actual AS (
+        SELECT team_id,
+               status,
+               COALESCE(assigned_to_id, '00000000-0000-0000-0000-000000000000'::uuid) AS assigned_to_id,
+               count(*) AS count
+        FROM tasks
+        WHERE team_id = :team_id AND NOT is_deleted
+        GROUP BY 1, 2, 3
+    ), fixed AS (
+        INSERT INTO task_counts AS c (team_id, status, assigned_to_id, count)
+        SELECT team_id, status, assigned_to_id, count FROM actual
+        ON CONFLICT (team_id, status, assigned_to_id)
+        DO UPDATE SET count = EXCLUDED.count
+        WHERE c.count <> EXCLUDED.count
+        RETURNING 1
+    ), cleared AS (
+        UPDATE task_counts c
+        SET count = 0
+        WHERE c.team_id = :team_id
+          AND c.count <> 0
+          AND NOT EXISTS (
+              SELECT 1 FROM actual a
+              WHERE a.status = c.status AND a.assigned_to_id = c.assigned_to_id
+          )
+        RETURNING 1
+    )
+    SELECT (SELECT count(*) FROM fixed) + (SELECT count(*) FROM cleared)
+""")
+
+LOCK_TEAM = text("SELECT 1 FROM task_counts WHERE team_id = :team_id FOR UPDATE")
+
+
+async def reconcile_team(db: AsyncSession, team_id: UUID) -> int:
+    """Repair one team's counters; returns how many groups were fixed."""
+    # Locking the team's counters first makes concurrent writers wait, so
+    # the recount cannot interleave with their trigger updates
+    await db.execute(LOCK_TEAM, {"team_id": team_id})
+    result = await db.execute(REPAIR_TEAM, {"team_id": team_id})
+    await db.commit()
+    return result.scalar_one()
+
+
+async def reconcile_task_counts(db: AsyncSession) -> dict[str, int]:
+    """Repair every team's counters, one short transaction per team."""
+    result = await db.execute(select(Team.id))
+    team_ids = result.scalars().all()
+    await db.commit()
+
+    repaired = 0
+    for team_id in team_ids:
+        repaired += await reconcile_team(db, team_id)
+
+    return {"teams": len(team_ids), "repaired_groups": repaired}
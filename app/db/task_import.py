@@ -0,0 +1,247 @@
+import codecs
+import csv
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import AsyncIterator
+
+import asyncpg
+
+from app.db.models.task import TaskStatus
+from app.schemas.task import TaskImportResult
+
+MAX_REPORTED_ERRORS = 100
+
+STAGING_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "created_by_id",
+    "assigned_to_id",
+    "team_id",
+    "created_at",
+)
+
+CREATE_STAGING = """
+    CREATE TEMP TABLE tasks_import (
+        id uuid NOT NULL,
+        title text NOT NULL,
+        description text,
+        status text NOT NULL,
+        created_by_id uuid NOT NULL,
+        assigned_to_id uuid,
+        team_id uuid NOT NULL,
+        created_at timestamptz
+    ) ON COMMIT DROP
+"""
+
+# Set-wise reference checks; each removes the rows it rejects
+REJECT_UNKNOWN_TEAM = """
+    DELETE FROM tasks_import s
+    WHERE NOT EXISTS (SELECT 1 FROM teams t WHERE t.id = s.team_id)
+"""
+
+REJECT_UNKNOWN_CREATOR = """
+    DELETE FROM tasks_import s
+    WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.id = s.created_by_id)
+"""
+
+REJECT_FOREIGN_ASSIGNEE = """
+    DELETE FROM tasks_import s
+    WHERE s.assigned_to_id IS NOT NULL
+      AND NOT EXISTS (
+          SELECT 1 FROM users u
+          WHERE u.id = s.assigned_to_id AND u.team_id = s.team_id
+      )
+"""
+
+MERGE = """
+    INSERT INTO tasks (
+        id, title, description, status, created_by_id, assigned_to_id,
+        team_id, created_at, updated_at
+    )
+    SELECT id, title, description, status::taskstatus, created_by_id,
+           assigned_to_id, team_id, COALESCE(created_at, now()), now()
+    FROM tasks_import s
+    -- Archived ids are taken too
+    WHERE NOT EXISTS (SELECT 1 FROM tasks_archive a WHERE a.id = s.id)
+    ON CONFLICT (id) DO NOTHING
+"""
+
+
+def _row_count(command_status: str) -> int:
+    # asyncpg returns the command tag, e.g. "DELETE 12" or "INSERT 0 500"
+    return int(command_status.rsplit(" ", 1)[-1])
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[list[str]]:
+    """Split a byte stream into lines, one list per incoming chunk."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    tail = ""
+
+    async for chunk in chunks:
+        lines = (tail + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+        yield [line + "\n" for line in lines]
+
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield [tail]
+
+
+async def csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[dict | str]:
+    """Rows of a CSV stream with a header line, as dicts.
+
+    Lines are only handed to the csv module once the quotes seen so far
+    balance, so quoted fields may contain newlines across chunk borders.
+    """
+    header = None
+    pending: list[str] = []
+    quotes = 0
+
+    async for lines in iter_lines(chunks):
+        complete = []
+        for line in lines:
+            pending.append(line)
+            quotes += line.count('"')
+            if quotes % 2 == 0:
+                complete.extend(pending)
+                pending = []
+                quotes = 0
+
+        for values in csv.reader(complete):
+            if not values:
+                continue
+            if header is None:
+                header = values
+                continue
+            yield dict(zip(header, values))
+
+    if pending:
+        yield "unterminated quoted field at end of input"
+
+
+async def ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[dict | str]:
+    async for lines in iter_lines(chunks):
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield f"invalid JSON: {exc}"
+
+
+def parse_rows(chunks: AsyncIterator[bytes], format: str) -> AsyncIterator[dict | str]:
+    """Rows as dicts; a str in the stream describes a row that failed to parse."""
+    if format == "csv":
+        return csv_rows(chunks)
+    return ndjson_rows(chunks)
+
+
+def _uuid(value) -> uuid.UUID | None:
+    return uuid.UUID(value) if value else None
+
+
+def _text(fields: dict, name: str) -> str | None:
+    value = fields.get(name)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{name} must be a string")
+    return value
+
+
+def _timestamp(value) -> datetime | None:
+    if not value:
+        return None
+    if not isinstance(value, str):
+        raise ValueError("created_at must be an ISO 8601 string")
+    parsed = datetime.fromisoformat(value)
+    # Same convention as the API: timestamps without an offset are UTC
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def to_record(fields: dict) -> tuple:
+    """One staging row. Anything COPY could not encode is rejected here,
+    so a bad value fails its own row rather than the whole import."""
+    title = _text(fields, "title")
+    if not title:
+        raise ValueError("title is required")
+    if len(title) > 255:
+        raise ValueError("title is longer than 255 characters")
+
+    created_by_id = _uuid(fields.get("created_by_id"))
+    team_id = _uuid(fields.get("team_id"))
+    if created_by_id is None or team_id is None:
+        raise ValueError("created_by_id and team_id are required")
+
+    return (
+        _uuid(fields.get("id")) or uuid.uuid4(),
+        title,
+        _text(fields, "description") or None,
+        TaskStatus(fields.get("status") or TaskStatus.OPEN).value,
+        created_by_id,
+        _uuid(fields.get("assigned_to_id")),
+        team_id,
+        _timestamp(fields.get("created_at")),
+    )
+
+
+async def _records(
+    rows: AsyncIterator[dict | str],
+    result: TaskImportResult,
+) -> AsyncIterator[tuple]:
+    async for row in rows:
+        result.received += 1
+        try:
+            if isinstance(row, str):
+                raise ValueError(row)
+            yield to_record(row)
+        except (ValueError, TypeError, AttributeError) as exc:
+            result.rejected += 1
+            if len(result.errors) < MAX_REPORTED_ERRORS:
+                result.errors.append(f"row {result.received}: {exc}")
+
+
+async def import_tasks(
+    conn: asyncpg.Connection,
+    rows: AsyncIterator[dict | str],
+) -> TaskImportResult:
+    """COPY rows into a staging table, validate set-wise, merge into tasks.
+
+    Runs in one transaction, so a failed import leaves nothing behind.
+    Tasks whose id already exists are skipped, which makes re-running an
+    import safe.
+    """
+    result = TaskImportResult()
+
+    async with conn.transaction():
+        await conn.execute(CREATE_STAGING)
+
+        # Streams straight from the parser: memory is bounded by a chunk
+        copied = _row_count(
+            await conn.copy_records_to_table(
+                "tasks_import",
+                records=_records(rows, result),
+                columns=STAGING_COLUMNS,
+            )
+        )
+
+        valid = copied
+        for statement, reason in (
+            (REJECT_UNKNOWN_TEAM, "unknown team_id"),
+            (REJECT_UNKNOWN_CREATOR, "unknown created_by_id"),
+            (REJECT_FOREIGN_ASSIGNEE, "assigned_to_id is not a member of the task's team"),
+        ):
+            rejected = _row_count(await conn.execute(statement))
+            if rejected:
+                valid -= rejected
+                result.rejected += rejected
+                result.errors.append(f"{rejected} rows: {reason}")
+
+        result.imported = _row_count(await conn.execute(MERGE))
+        result.duplicates = valid - result.imported
+
+    return result
@@ -0,0 +1,23 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.principal import Principal
+from app.db.models.task_version import TaskVersion
+from app.schemas.user import UserRole
+
+
+async def visible_version(db: AsyncSession, current_user: Principal) -> int:
+    """Change version covering every task the user can see.
+
+    One primary-key lookup for MANAGERs and MEMBERs; ADMINs see all teams,
+    so theirs is the sum over teams, which also only ever grows.
+    """
+    if current_user.role == UserRole.ADMIN:
+        query = select(func.coalesce(func.sum(TaskVersion.version), 0))
+    else:
+        query = select(TaskVersion.version).where(
+            TaskVersion.team_id == current_user.team_id
+        )
+
+    result = await db.execute(query)
+    return result.scalar_one_or_none() or 0
@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime, timezone
+from itertools import product
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from app.core.principal import Principal
+from app.db.models.task import TaskStatus
+from app.db.queries import TEAM_MEMBER_ID, UPDATE_TASK, USER_BY_ID, task_list
+from app.db.task_versions import visible_version
+from app.schemas.user import UserRole
+
+NIL = UUID(int=0)
+# An aware timestamp, as decoded from a list cursor
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+async def warm_connection(conn: AsyncConnection, writes: bool) -> None:
+    """Run the hot statements once on ``conn``.
+
+    SQLAlchemy compiles them and asyncpg prepares them and loads their
+    column types (the enum codecs need catalog lookups), so the first real
+    requests skip that work. Nothing matches the nil ids and the
+    transaction is rolled back.
+    """
+    async with AsyncSession(bind=conn) as db:
+        await db.execute(USER_BY_ID, {"user_id": NIL})
+        await db.execute(TEAM_MEMBER_ID, {"user_id": NIL, "team_id": NIL})
+
+        for role in UserRole:
+            principal = Principal(id=NIL, email="", role=role, team_id=NIL)
+            await visible_version(db, principal)
+            # First pages and cursor pages, with and without a status filter
+            for status, after in product((False, True), repeat=2):
+                await db.execute(
+                    task_list(role, status=status, assignee=False, after=after),
+                    {
+                        "team_id": NIL,
+                        "user_id": NIL,
+                        "status": TaskStatus.OPEN,
+                        "after_created_at": EPOCH,
+                        "after_id": NIL,
+                        "skip": 0,
+                        "limit": 0,
+                    },
+                )
+
+            if writes:
+                await db.execute(
+                    UPDATE_TASK[role],
+                    {
+                        "task_id": NIL,
+                        "new_title": None,
+                        "new_description": None,
+                        "new_status": None,
+                        "assignee_id": None,
+                        "scope_team_id": NIL,
+                    },
+                )
+
+        await db.rollback()
+
+
+async def warm_up(engine: AsyncEngine, connections: int, writes: bool = True) -> None:
+    """Open ``connections`` pooled connections at once and warm each."""
+    conns = [engine.connect() for _ in range(connections)]
+    try:
+        # All checked out together, so the pool really opens that many.
+        # Let every attempt finish before raising, so none is left behind.
+        started = await asyncio.gather(
+            *(conn.start() for conn in conns), return_exceptions=True
+        )
+        for result in started:
+            if isinstance(result, BaseException):
+                raise result
+
+        await asyncio.gather(*(warm_connection(conn, writes) for conn in conns))
+    finally:
+        for conn in conns:
+            if conn.sync_connection is not None:
+                await conn.close()
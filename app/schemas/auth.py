@@ -8,3 +8,10 @@ class LoginRequest(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    # With jwt_embed_claims on: exchange at POST /auth/refresh when the
+    # short-lived access token expires
+    refresh_token: str | None = None
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
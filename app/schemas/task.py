@@ -32,6 +32,10 @@ class TaskRead(BaseModel):
     class Config:
         from_attributes = True
 
+class TaskArchived(TaskRead):
+    archived_at: datetime
+
+
 class TaskResponse(BaseModel):
     id: UUID
     title: str
@@ -50,3 +54,54 @@ class TaskUpdate(BaseModel):
     description: Optional[str] = None
     status: Optional[TaskStatus] = None
     assignee_id: Optional[UUID] = None
+
+class TaskBulkCreateResult(BaseModel):
+    index: int
+    task: Optional[TaskRead] = None
+    error: Optional[str] = None
+
+class TaskBulkFilter(BaseModel):
+    status: Optional[TaskStatus] = None
+    assignee_id: Optional[UUID] = None
+    team_id: Optional[UUID] = None
+
+
+class TaskBulkUpdate(BaseModel):
+    ids: Optional[list[UUID]] = None
+    filter: Optional[TaskBulkFilter] = None
+    patch: TaskUpdate
+    # Filter-only updates: continue after this task id (a previous next)
+    after: Optional[UUID] = None
+
+
+class TaskBulkUpdateResult(BaseModel):
+    updated: int
+    ids: list[UUID]
+    # Filter-only updates change at most tasks_bulk_max_items tasks per
+    # request; when set, send it back as after for the next page
+    next: Optional[UUID] = None
+
+
+class TaskImportResult(BaseModel):
+    received: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    errors: list[str] = []
+
+
+class TaskStatsRow(BaseModel):
+    team_id: UUID
+    status: TaskStatus
+    assignee_id: Optional[UUID]
+    count: int
+
+
+class TaskChanges(BaseModel):
+    tasks: list[TaskRead]
+    # Ids of tasks deleted, archived or (for MEMBERs) reassigned away
+    # since the watermark
+    deleted: list[UUID]
+    # Pass back as ?since= on the next sync; null until something changed
+    next: Optional[str]
+    has_more: bool
@@ -0,0 +1,87 @@
+"""factory-boy factories for the benchmark dataset.
+
+They build plain dicts (one per row) rather than ORM objects: the seeder
+streams millions of them into COPY. Every value comes from factory-boy's
+seeded random generator, so ``reseed(n)`` makes a dataset reproducible,
+ids included.
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import factory
+import factory.random
+
+from app.db.models.task import TaskStatus
+from app.db.models.user import UserRole
+
+BENCH_PASSWORD = "bench-password"
+
+# Tasks are spread over the year before this instant
+EPOCH = datetime(2026, 1, 1)
+
+
+def reseed(seed: int) -> None:
+    factory.random.reseed_random(seed)
+
+
+def random_uuid() -> uuid.UUID:
+    return uuid.UUID(int=factory.random.randgen.getrandbits(128), version=4)
+
+
+def user_email(n: int) -> str:
+    return f"bench-user-{n}@example.com"
+
+
+class TeamFactory(factory.DictFactory):
+    id = factory.LazyFunction(random_uuid)
+    name = factory.Sequence(lambda n: f"bench-team-{n}")
+
+
+class UserFactory(factory.DictFactory):
+    """Needs team_id; pass n to get the matching bench-user-<n> email."""
+
+    class Params:
+        n = factory.Sequence(lambda n: n)
+
+    id = factory.LazyFunction(random_uuid)
+    email = factory.LazyAttribute(lambda o: user_email(o.n))
+    password_hash = None  # hashed once by the seeder, bcrypt is too slow per row
+    role = UserRole.MEMBER.value
+    team_id = None
+
+
+class TaskFactory(factory.DictFactory):
+    """Needs team_id and team_members (the team's user ids)."""
+
+    class Params:
+        team_members = ()
+        has_description = factory.LazyFunction(
+            lambda: factory.random.randgen.random() < 0.5
+        )
+
+    id = factory.LazyFunction(random_uuid)
+    title = factory.Faker("sentence", nb_words=6)
+    description = factory.Maybe(
+        "has_description",
+        yes_declaration=factory.Faker("paragraph", nb_sentences=3),
+        no_declaration=None,
+    )
+    status = factory.LazyFunction(
+        lambda: factory.random.randgen.choice(list(TaskStatus)).value
+    )
+    created_by_id = factory.LazyAttribute(
+        lambda o: factory.random.randgen.choice(o.team_members)
+    )
+    # One task in five is unassigned
+    assigned_to_id = factory.LazyAttribute(
+        lambda o: factory.random.randgen.choice(o.team_members)
+        if factory.random.randgen.random() < 0.8
+        else None
+    )
+    team_id = None
+    # 2% of tasks are soft-deleted
+    is_deleted = factory.LazyFunction(lambda: factory.random.randgen.random() < 0.02)
+    created_at = factory.LazyFunction(
+        lambda: EPOCH - timedelta(seconds=factory.random.randgen.randrange(365 * 86400))
+    )
+    updated_at = factory.LazyAttribute(lambda o: o.created_at)
@@ -0,0 +1,88 @@
+"""Compare the old and the lean list_tasks encoding on 1,000-row pages.
+
+old:  hydrate Task entities, validate each into TaskResponse, dump and
+      render the way FastAPI's response_model + JSONResponse does
+lean: row tuples -> dicts -> pydantic_core.to_json
+
+No database needed; rows are synthesized in memory, so this isolates
+the per-request CPU spent between the driver and the socket.
+
+    python -m benchmarks.list_encoding
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+from app.api.tasks import TASK_RESPONSE_FIELDS
+from app.db.models.task import Task, TaskStatus
+from app.schemas.task import TaskResponse
+
+response_adapter = TypeAdapter(list[TaskResponse])
+
+
+def make_rows(count: int) -> list[tuple]:
+    team_id = uuid.uuid4()
+    users = [uuid.uuid4() for _ in range(20)]
+    start = datetime(2026, 1, 1)
+    return [
+        (
+            uuid.uuid4(),
+            f"Task {i}",
+            "Some description " * 5 if i % 2 else None,
+            list(TaskStatus)[i % 3],
+            users[i % 20],
+            users[(i + 7) % 20] if i % 4 else None,
+            team_id,
+            start + timedelta(seconds=i, microseconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def encode_old(rows: list[tuple]) -> bytes:
+    tasks = [Task(**dict(zip(TASK_RESPONSE_FIELDS, row))) for row in rows]
+    content = response_adapter.dump_python(
+        response_adapter.validate_python(tasks, from_attributes=True),
+        mode="json",
+    )
+    return JSONResponse(content).body
+
+
+def encode_lean(rows: list[tuple]) -> bytes:
+    return to_json([dict(zip(TASK_RESPONSE_FIELDS, row)) for row in rows])
+
+
+def best_of(fn, rows, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(rows)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    assert encode_old(rows) == encode_lean(rows), "wire format differs"
+
+    old = best_of(encode_old, rows, args.repeat)
+    lean = best_of(encode_lean, rows, args.repeat)
+
+    print(f"rows per page: {args.rows}")
+    print(f"old:  {old * 1000:8.2f} ms")
+    print(f"lean: {lean * 1000:8.2f} ms")
+    print(f"speedup: {old / lean:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""Drive the API at fixed concurrency levels and report latency percentiles.
+
+Needs a server running against a database seeded by benchmarks.seed
+(pass the same --teams), e.g.:
+
+    uvicorn app.main:app --workers 4
+    python -m benchmarks.load run --concurrency 1 8 32 --output baseline.json
+    ... change things ...
+    python -m benchmarks.load run --concurrency 1 8 32 --baseline baseline.json
+
+Each scenario sends --requests requests at each concurrency level, after
+--warmup requests that are not recorded. Results are JSON: p50/p95/p99
+latency in ms, throughput and error count per scenario and level.
+
+With --baseline (or `compare BASELINE RESULTS`), a scenario regresses
+when its p95 grows or its throughput drops by more than --tolerance;
+the exit status is then 1.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+import httpx
+
+from benchmarks.factories import BENCH_PASSWORD, user_email
+from benchmarks.seed import ADMIN_EMAIL
+
+SCENARIOS = (
+    "login",
+    "me",
+    "list_admin",
+    "list_manager",
+    "list_member",
+    "create",
+    "update",
+    "delete",
+)
+
+# Actors are spread over this many teams
+ACTOR_TEAMS = 16
+
+
+@dataclass
+class Actor:
+    email: str
+    token: str
+    id: str
+
+    @property
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+async def log_in(client: httpx.AsyncClient, email: str) -> Actor:
+    response = await client.post(
+        "/auth/login", data={"username": email, "password": BENCH_PASSWORD}
+    )
+    response.raise_for_status()
+    token = response.json()["access_token"]
+
+    me = await client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+    me.raise_for_status()
+    return Actor(email=email, token=token, id=me.json()["id"])
+
+
+async def actors(client: httpx.AsyncClient, teams: int) -> dict[str, list[Actor]]:
+    # User n is in team n % teams and the first user of a team is its manager
+    count = min(ACTOR_TEAMS, teams)
+    return {
+        "admin": [await log_in(client, ADMIN_EMAIL)],
+        "manager": [await log_in(client, user_email(t)) for t in range(count)],
+        "member": [await log_in(client, user_email(t + teams)) for t in range(count)],
+    }
+
+
+async def create_tasks(client: httpx.AsyncClient, manager: Actor, assignee: Actor, count: int) -> list[str]:
+    ids = []
+    for start in range(0, count, 1000):
+        response = await client.post(
+            "/tasks/bulk",
+            headers=manager.headers,
+            json=[
+                {"title": f"bench task {i}", "assignee_id": assignee.id}
+                for i in range(start, min(start + 1000, count))
+            ],
+        )
+        response.raise_for_status()
+        ids.extend(item["task"]["id"] for item in response.json() if item["task"])
+    return ids
+
+
+Operation = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+async def scenario(
+    name: str,
+    client: httpx.AsyncClient,
+    people: dict[str, list[Actor]],
+    total: int,
+) -> Operation:
+    """The request for call number i of a scenario; does any setup first."""
+    admins, managers, members = people["admin"], people["manager"], people["member"]
+
+    def pick(group: list[Actor], i: int) -> Actor:
+        return group[i % len(group)]
+
+    if name == "login":
+        return lambda c, i: c.post(
+            "/auth/login",
+            data={"username": pick(members, i).email, "password": BENCH_PASSWORD},
+        )
+    if name == "me":
+        return lambda c, i: c.get("/auth/me", headers=pick(members, i).headers)
+    if name.startswith("list_"):
+        group = {"list_admin": admins, "list_manager": managers, "list_member": members}[name]
+        return lambda c, i: c.get("/tasks/?limit=20", headers=pick(group, i).headers)
+    if name == "create":
+        return lambda c, i: c.post(
+            "/tasks",
+            headers=pick(managers, i).headers,
+            json={"title": f"bench create {i}", "assignee_id": pick(members, i).id},
+        )
+    if name == "update":
+        # A few tasks per manager, updated over and over
+        owned = [
+            (manager, await create_tasks(client, manager, pick(members, n), 4))
+            for n, manager in enumerate(managers)
+        ]
+
+        def update(c, i):
+            manager, ids = pick(owned, i)
+            return c.put(
+                f"/tasks/{ids[i % len(ids)]}",
+                headers=manager.headers,
+                json={"title": f"bench update {i}"},
+            )
+        return update
+    if name == "delete":
+        # One fresh task per call, created up front
+        manager, member = managers[0], members[0]
+        ids = await create_tasks(client, manager, member, total)
+        return lambda c, i: c.delete(f"/tasks/{ids[i]}", headers=manager.headers)
+
+    raise ValueError(f"Unknown scenario: {name}")
+
+
+async def drive(client: httpx.AsyncClient, operation: Operation, first: int, count: int, concurrency: int):
+    latencies: list[float] = []
+    errors = 0
+    calls = iter(range(first, first + count))
+
+    async def worker():
+        nonlocal errors
+        for i in calls:
+            started = time.perf_counter()
+            try:
+                response = await operation(client, i)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+    }
+
+
+async def run(args) -> dict:
+    limits = httpx.Limits(max_connections=max(args.concurrency))
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        people = await actors(client, args.teams)
+        results: dict[str, dict[str, dict]] = {}
+
+        for name in args.scenarios:
+            for concurrency in args.concurrency:
+                total = args.warmup + args.requests
+                operation = await scenario(name, client, people, total)
+
+                await drive(client, operation, 0, args.warmup, concurrency)
+                latencies, errors, elapsed = await drive(
+                    client, operation, args.warmup, args.requests, concurrency
+                )
+
+                summary = summarize(latencies, errors, elapsed)
+                results.setdefault(name, {})[str(concurrency)] = summary
+                print(f"{name:14} c={concurrency:<4} {summary}", file=sys.stderr)
+
+    return {
+        "meta": {
+            "base_url": args.base_url,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> list[str]:
+    """Regressions of current against baseline, as printable lines."""
+    regressions = []
+    for name, levels in current["results"].items():
+        for concurrency, now in levels.items():
+            before = baseline["results"].get(name, {}).get(concurrency)
+            if before is None:
+                continue
+
+            p95 = now["p95_ms"] / before["p95_ms"] - 1
+            throughput = now["throughput_rps"] / before["throughput_rps"] - 1
+            line = (
+                f"{name:14} c={concurrency:<4} p95 {before['p95_ms']:.1f} -> {now['p95_ms']:.1f} ms "
+                f"({p95:+.0%}), throughput {before['throughput_rps']:.0f} -> "
+                f"{now['throughput_rps']:.0f} rps ({throughput:+.0%})"
+            )
+            if p95 > tolerance or throughput < -tolerance or now["errors"] > before["errors"]:
+                regressions.append(line)
+                line += "  REGRESSION"
+            print(line, file=sys.stderr)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the scenarios")
+    run_parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    run_parser.add_argument("--teams", type=int, default=2_000, help="as given to benchmarks.seed")
+    run_parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    run_parser.add_argument("--requests", type=int, default=2_000)
+    run_parser.add_argument("--warmup", type=int, default=200)
+    run_parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    run_parser.add_argument("--output", help="write results JSON here instead of stdout")
+    run_parser.add_argument("--baseline", help="results JSON to compare against")
+    run_parser.add_argument("--tolerance", type=float, default=0.10)
+
+    compare_parser = commands.add_parser("compare", help="compare two saved results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("--tolerance", type=float, default=0.10)
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.results) as f:
+            current = json.load(f)
+        return 1 if compare(baseline, current, args.tolerance) else 0
+
+    current = asyncio.run(run(args))
+    output = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            return 1 if compare(json.load(f), current, args.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Seed a realistic benchmark dataset with the factory-boy factories.
+
+Defaults: 2,000 teams, 200,000 users and 2,000,000 tasks. User n is
+bench-user-<n>@example.com in team n % teams; the first user of each team
+is its MANAGER. bench-admin@example.com is the ADMIN. Every password is
+``bench-password``.
+
+Rows go in through COPY, so the statement-level triggers keep
+task_counts and task_versions in step. Run against a throwaway database
+that is migrated to head:
+
+    alembic upgrade head
+    python -m benchmarks.seed --seed 1
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from app.core.security import hash_password
+from app.db.models.user import UserRole
+from app.db.session import engine
+from benchmarks.factories import (
+    BENCH_PASSWORD,
+    TaskFactory,
+    TeamFactory,
+    UserFactory,
+    reseed,
+)
+
+ADMIN_EMAIL = "bench-admin@example.com"
+
+TEAM_COLUMNS = ("id", "name")
+USER_COLUMNS = ("id", "email", "password_hash", "role", "team_id")
+TASK_COLUMNS = (
+    "id", "title", "description", "status", "created_by_id",
+    "assigned_to_id", "team_id", "is_deleted", "created_at", "updated_at",
+)
+
+
+async def copy(conn, table: str, columns: tuple, rows: list[dict]) -> None:
+    await conn.copy_records_to_table(
+        table,
+        records=[tuple(row[column] for column in columns) for row in rows],
+        columns=columns,
+    )
+
+
+async def seed(teams: int, users: int, tasks: int, batch_size: int) -> None:
+    if users < teams:
+        raise SystemExit("--users must be at least --teams (one manager per team)")
+
+    password_hash = hash_password(BENCH_PASSWORD)
+
+    async with engine.connect() as sa_conn:
+        # Straight to asyncpg: COPY, and transactions we commit per batch
+        raw = await sa_conn.get_raw_connection()
+        conn = raw.driver_connection
+
+        if await conn.fetchval("SELECT 1 FROM users WHERE email = $1", ADMIN_EMAIL):
+            raise SystemExit("Benchmark data is already seeded")
+
+        async with conn.transaction():
+            team_rows = TeamFactory.build_batch(teams)
+            await copy(conn, "teams", TEAM_COLUMNS, team_rows)
+
+            members: list[list] = [[] for _ in range(teams)]
+            user_rows = [
+                UserFactory.build(
+                    n=n,
+                    team_id=team_rows[n % teams]["id"],
+                    role=(UserRole.MANAGER if n < teams else UserRole.MEMBER).value,
+                    password_hash=password_hash,
+                )
+                for n in range(users)
+            ]
+            user_rows.append(
+                UserFactory.build(
+                    email=ADMIN_EMAIL,
+                    role=UserRole.ADMIN.value,
+                    password_hash=password_hash,
+                )
+            )
+            for n, row in enumerate(user_rows[:users]):
+                members[n % teams].append(row["id"])
+            await copy(conn, "users", USER_COLUMNS, user_rows)
+            print(f"teams: {teams}, users: {len(user_rows)}", file=sys.stderr)
+
+        # Tasks in batches, each its own transaction, so progress is kept
+        started = time.perf_counter()
+        for offset in range(0, tasks, batch_size):
+            count = min(batch_size, tasks - offset)
+            rows = []
+            for i in range(offset, offset + count):
+                team = i % teams
+                rows.append(TaskFactory.build(
+                    team_id=team_rows[team]["id"],
+                    team_members=members[team],
+                ))
+            async with conn.transaction():
+                await copy(conn, "tasks", TASK_COLUMNS, rows)
+
+            done = offset + count
+            rate = done / (time.perf_counter() - started)
+            print(f"tasks: {done}/{tasks} ({rate:,.0f}/s)", file=sys.stderr)
+
+        for table in ("teams", "users", "tasks", "task_counts", "task_versions"):
+            await conn.execute(f"ANALYZE {table}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=2_000)
+    parser.add_argument("--users", type=int, default=200_000)
+    parser.add_argument("--tasks", type=int, default=2_000_000)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=1, help="random seed; same seed, same data")
+    args = parser.parse_args()
+
+    reseed(args.seed)
+    asyncio.run(seed(args.teams, args.users, args.tasks, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
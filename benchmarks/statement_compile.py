@@ -0,0 +1,109 @@
+"""Per-request SQL construction + compile cost: rebuilt vs precompiled.
+
+rebuilt:     the select()/update() built per request, as the endpoints did
+             before app.db.queries
+precompiled: the statements from app.db.queries
+
+Each iteration builds the statement (rebuilt only) and resolves it against
+a compiled cache, which is the work Connection.execute does before
+anything reaches the driver. No database needed.
+
+    python -m benchmarks.statement_compile
+"""
+import argparse
+import time
+import uuid
+
+from sqlalchemy import false, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+import app.db.models  # noqa: F401  (configure mappers)
+from app.db import queries
+from app.db.models.task import Task, TaskStatus
+from app.db.models.user import User
+from app.schemas.user import UserRole
+
+dialect = PGDialect_asyncpg()
+
+USER_ID = uuid.uuid4()
+TEAM_ID = uuid.uuid4()
+TASK_ID = uuid.uuid4()
+
+
+def resolve(stmt, compiled_cache: dict) -> None:
+    # What Connection.execute does: cache key -> compiled statement
+    stmt._compile_w_cache(
+        dialect,
+        compiled_cache=compiled_cache,
+        column_keys=[],
+        for_executemany=False,
+        schema_translate_map=None,
+        linting=0,
+    )
+
+
+def rebuilt_statements() -> list:
+    user = select(User).where(User.id == USER_ID)
+
+    assignee = select(User.id).where(User.id == USER_ID, User.team_id == TEAM_ID)
+    update_task = (
+        update(Task)
+        .where(Task.id == TASK_ID, Task.is_deleted == false())
+        .where(Task.team_id == TEAM_ID)
+        .where(assignee.exists())
+        .values(title="t", status=TaskStatus.DONE, assigned_to_id=USER_ID, updated_at=func.now())
+        .returning(Task)
+        .execution_options(synchronize_session=False)
+    )
+
+    list_tasks = (
+        select(*queries.TASK_RESPONSE_COLUMNS)
+        .where(Task.is_deleted == false())
+        .where(or_(Task.created_by_id == USER_ID, Task.assigned_to_id == USER_ID))
+        .where(Task.status == TaskStatus.OPEN)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .where(tuple_(Task.created_at, Task.id) < tuple_(func.now(), TASK_ID))
+        .limit(11)
+    )
+
+    return [user, assignee, update_task, list_tasks]
+
+
+def precompiled_statements() -> list:
+    return [
+        queries.USER_BY_ID,
+        queries.TEAM_MEMBER_ID,
+        queries.UPDATE_TASK[UserRole.MANAGER],
+        queries.task_list(UserRole.MEMBER, status=True, assignee=False, after=True),
+    ]
+
+
+def per_request(build, iterations: int) -> float:
+    compiled_cache = {}
+    for stmt in build():  # warm the cache, as a running server would be
+        resolve(stmt, compiled_cache)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for stmt in build():
+            resolve(stmt, compiled_cache)
+    return (time.perf_counter() - started) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rebuilt = min(per_request(rebuilt_statements, args.iterations) for _ in range(args.repeat))
+    precompiled = min(per_request(precompiled_statements, args.iterations) for _ in range(args.repeat))
+
+    print("statements per request: 4 (auth user, assignee check, update, list)")
+    print(f"rebuilt:     {rebuilt * 1e6:8.1f} us")
+    print(f"precompiled: {precompiled * 1e6:8.1f} us")
+    print(f"speedup: {rebuilt / precompiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
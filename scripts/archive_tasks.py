@@ -0,0 +1,59 @@
+"""Move deleted and long-DONE tasks from tasks into tasks_archive.
+
+Runs in small batches, one short transaction each, pausing in between so
+the primary and its replicas keep up. Safe to stop at any point and to
+run periodically (e.g. nightly from cron); an interrupted run resumes
+where it stopped:
+
+    python -m scripts.archive_tasks --batch-size 1000 --pause 0.2
+
+Archived tasks are read through GET /tasks/archive.
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, engine
+from app.db.task_archive import PASSES, archive_pass
+
+
+async def run(args) -> int:
+    older_than = {
+        "deleted": args.deleted_after_days,
+        "done": args.done_after_days,
+    }
+
+    result = {}
+    async with AsyncSessionLocal() as db:
+        for name in args.passes:
+            result[name] = await archive_pass(
+                db,
+                name,
+                older_than_days=older_than[name],
+                batch_size=args.batch_size,
+                pause=args.pause,
+                max_batches=args.max_batches,
+            )
+    await engine.dispose()
+
+    print(json.dumps({"archived": result}))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--pause", type=float, default=0.2, help="seconds between batches")
+    parser.add_argument("--max-batches", type=int, help="per pass; stop early and resume next run")
+    parser.add_argument("--deleted-after-days", type=int, default=settings.archive_deleted_after_days)
+    parser.add_argument("--done-after-days", type=int, default=settings.archive_done_after_days)
+    parser.add_argument("--passes", nargs="+", choices=list(PASSES), default=list(PASSES))
+    args = parser.parse_args()
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Bulk-load tasks from a CSV or NDJSON file through COPY.
+
+Same path as POST /tasks/import, without the HTTP upload:
+
+    python -m scripts.import_tasks legacy_tasks.csv
+    python -m scripts.import_tasks --format ndjson legacy_tasks.ndjson
+
+Columns/keys: title, created_by_id and team_id are required; id,
+description, status, assigned_to_id and created_at are optional.
+"""
+import argparse
+import asyncio
+import sys
+
+from app.db.session import engine
+from app.db.task_import import import_tasks, parse_rows
+
+CHUNK_SIZE = 1024 * 1024
+
+
+async def read_chunks(path: str):
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+async def run(path: str, format: str) -> int:
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        result = await import_tasks(
+            raw.driver_connection,
+            parse_rows(read_chunks(path), format),
+        )
+    await engine.dispose()
+
+    print(result.model_dump_json(indent=2))
+    return 1 if result.rejected else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=("csv", "ndjson"))
+    args = parser.parse_args()
+
+    format = args.format or ("ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv")
+    return asyncio.run(run(args.path, format))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""Recount live tasks per team and repair drift in task_counts.
+
+The counters are kept current by triggers; run this periodically (e.g.
+nightly from cron) to repair anything changed behind their back:
+
+    python -m scripts.reconcile_task_counts
+"""
+import asyncio
+import json
+import sys
+
+from app.db.session import AsyncSessionLocal, engine
+from app.db.task_counts import reconcile_task_counts
+
+
+async def run() -> int:
+    async with AsyncSessionLocal() as db:
+        result = await reconcile_task_counts(db)
+    await engine.dispose()
+
+    print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
@@ -0,0 +1,95 @@
+"""Shared fixtures. The tests run against the Postgres in DATABASE_URL,
+migrated to head (``alembic upgrade head``); they are skipped when it is
+not reachable. Every test works on teams and users of its own, made with
+``seed`` and removed afterwards, so a database that is also used for
+development is fine."""
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.core.principal import Principal
+from app.schemas.user import UserRole
+
+# Every table holding rows of a team, children first
+TEAM_TABLES = ("tasks_archive", "tasks", "task_counts", "task_versions", "task_unassignments")
+
+
+@pytest.fixture(scope="session")
+def sync_engine():
+    engine = create_engine(settings.database_url_sync)
+    try:
+        with engine.connect():
+            pass
+    except OperationalError as exc:
+        pytest.skip(f"Postgres is not reachable: {exc.orig}")
+
+    yield engine
+    engine.dispose()
+
+
+class Seed:
+    """Creates teams and users with unique names, and deletes them along
+    with everything in TEAM_TABLES that belongs to those teams."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.team_ids: list[uuid.UUID] = []
+        self.emails: list[str] = []
+
+    def team(self, label: str) -> uuid.UUID:
+        team_id = uuid.uuid4()
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO teams (id, name) VALUES (:id, :name)"),
+                {"id": team_id, "name": f"{label}-{team_id.hex[:8]}"},
+            )
+        self.team_ids.append(team_id)
+        return team_id
+
+    def user(
+        self,
+        label: str,
+        role: UserRole,
+        team_id: uuid.UUID | None = None,
+        password_hash: str = "x",
+    ) -> Principal:
+        principal = Principal(
+            id=uuid.uuid4(),
+            email=f"{label}-{uuid.uuid4().hex[:8]}@example.com",
+            role=role,
+            team_id=team_id,
+        )
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("""
+                    INSERT INTO users (id, email, password_hash, role, team_id)
+                    VALUES (:id, :email, :password_hash, :role, :team_id)
+                """),
+                {"id": principal.id, "email": principal.email, "password_hash": password_hash,
+                 "role": role.value, "team_id": team_id},
+            )
+        self.emails.append(principal.email)
+        return principal
+
+    def forget(self, email: str) -> None:
+        """Also delete a user the test created some other way."""
+        self.emails.append(email)
+
+    def cleanup(self) -> None:
+        params = {"teams": self.team_ids, "emails": self.emails}
+        with self.engine.begin() as conn:
+            for table in TEAM_TABLES:
+                conn.execute(text(f"DELETE FROM {table} WHERE team_id = ANY(:teams)"), params)
+            conn.execute(text("DELETE FROM users WHERE email = ANY(:emails)"), params)
+            conn.execute(text("DELETE FROM teams WHERE id = ANY(:teams)"), params)
+
+
+@pytest.fixture(scope="module")
+def seed(sync_engine):
+    """Teams and users for a test module, cleaned up when it finishes."""
+    seed = Seed(sync_engine)
+    yield seed
+    seed.cleanup()
@@ -0,0 +1,272 @@
+"""How many SQL statements each auth and tasks endpoint may issue.
+
+Calls every route in app/api/auth.py and app/api/tasks.py in-process and
+counts the statements SQLAlchemy sends while each call runs; a call that
+goes over its budget, or answers with an unexpected status, fails and
+lists the statements it ran.
+
+Budgets assume a warm auth cache (the steady state: the principal is
+cached after a caller's first request) and a cold task cache. Triggers
+run server-side and are not counted. No read replica may be configured.
+"""
+import asyncio
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from app.core.security import create_refresh_token, hash_password
+from app.core.task_cache import task_cache
+from app.core.task_events import task_events
+from app.db.models.task import Task
+from app.db.models.user import UserRole
+from app.db.session import AsyncSessionLocal, engine
+from app.main import app
+
+# The app's engine and pool belong to one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+PASSWORD = "budget-check-password"
+
+REGISTER_EMAIL = f"budget-{uuid.uuid4().hex}@example.com"
+
+
+@dataclass
+class Budget:
+    name: str
+    role: UserRole | None
+    method: str
+    path: str
+    max_statements: int
+    expected_status: int = 200
+    json: object = None
+    data: dict | None = None
+    content: bytes | None = None
+    headers: dict | None = None
+    # Fetched outside the count first; its ETag and X-Next-Cursor are
+    # available to the call as {etag} and {cursor}
+    prime: str | None = None
+    # Server-Sent Events: disconnect after the first chunk
+    stream: bool = False
+
+
+BUDGETS = [
+    # Auth
+    Budget("register", None, "POST", "/auth/register", 3, 201,
+           json={"email": REGISTER_EMAIL, "password": PASSWORD, "role": "MEMBER"}),
+    Budget("login", None, "POST", "/auth/login", 1,
+           data={"username": "{member_email}", "password": PASSWORD}),
+    Budget("refresh", None, "POST", "/auth/refresh", 1,
+           json={"refresh_token": "{refresh_token}"}),
+    Budget("refresh token as bearer", None, "GET", "/auth/me", 0, 401,
+           headers={"Authorization": "Bearer {refresh_token}"}),
+    Budget("me", UserRole.MEMBER, "GET", "/auth/me", 0),
+    Budget("cache stats", UserRole.ADMIN, "GET", "/auth/cache-stats", 0),
+    Budget("hashing stats", UserRole.ADMIN, "GET", "/auth/hashing-stats", 0),
+
+    # Task writes
+    Budget("create", UserRole.MANAGER, "POST", "/tasks", 2, 201,
+           json={"title": "budget task", "assignee_id": "{member_id}"}),
+    Budget("bulk create", UserRole.MANAGER, "POST", "/tasks/bulk", 2,
+           json=[{"title": f"budget bulk {i}", "assignee_id": "{member_id}"} for i in range(3)]),
+    Budget("bulk update", UserRole.MANAGER, "PATCH", "/tasks/bulk", 2,
+           json={"ids": ["{task_id}"], "patch": {"status": "IN_PROGRESS",
+                                                "assignee_id": "{member_id}"}}),
+    Budget("bulk update by filter", UserRole.MANAGER, "PATCH", "/tasks/bulk", 1,
+           json={"filter": {"assignee_id": "{member_id}"}, "patch": {"description": "budget"}}),
+    Budget("update", UserRole.MANAGER, "PUT", "/tasks/{task_id}", 1,
+           json={"title": "budget task, renamed", "assignee_id": "{member_id}"}),
+    # COPY runs on the raw asyncpg connection, around SQLAlchemy
+    Budget("import", UserRole.ADMIN, "POST", "/tasks/import?format=ndjson", 0,
+           content=b""),
+
+    # Task reads
+    Budget("list as admin", UserRole.ADMIN, "GET", "/tasks/", 2),
+    Budget("list as manager", UserRole.MANAGER, "GET", "/tasks/?status=OPEN", 2),
+    Budget("list by assignee", UserRole.MANAGER, "GET", "/tasks/?assignee_id={member_id}", 3),
+    Budget("list as member", UserRole.MEMBER, "GET", "/tasks/?limit=2", 2),
+    # Over tasks_list_max_limit: clamped, not rejected; below 1: rejected
+    Budget("list, large limit", UserRole.MEMBER, "GET", "/tasks/?limit=5000", 2),
+    Budget("list, limit 0", UserRole.MEMBER, "GET", "/tasks/?limit=0", 0, 422),
+    Budget("list, page 2", UserRole.MEMBER, "GET", "/tasks/?limit=2&cursor={cursor}", 2,
+           prime="/tasks/?limit=2"),
+    Budget("list, not modified", UserRole.MEMBER, "GET", "/tasks/?limit=2", 1, 304,
+           headers={"If-None-Match": "{etag}"}, prime="/tasks/?limit=2"),
+    Budget("read", UserRole.MEMBER, "GET", "/tasks/{task_id}", 1),
+    Budget("search", UserRole.MEMBER, "GET", "/tasks/search?q=budget", 1),
+    Budget("stats", UserRole.MANAGER, "GET", "/tasks/stats", 1),
+    Budget("changes", UserRole.MEMBER, "GET", "/tasks/changes", 1),
+    Budget("archive", UserRole.MEMBER, "GET", "/tasks/archive", 1),
+    Budget("export", UserRole.MANAGER, "GET", "/tasks/export", 1),
+    # The principal comes from the auth cache and LISTEN runs on its own
+    # asyncpg connection, so holding a stream open costs no statements
+    Budget("events", UserRole.MEMBER, "GET", "/tasks/events", 0, stream=True),
+
+    Budget("delete", UserRole.MANAGER, "DELETE", "/tasks/{doomed_id}", 1, 204),
+]
+
+
+def _fill(value, state: dict):
+    if isinstance(value, str):
+        return value.format(**state) if "{" in value else value
+    if isinstance(value, list):
+        return [_fill(item, state) for item in value]
+    if isinstance(value, dict):
+        return {key: _fill(item, state) for key, item in value.items()}
+    return value
+
+
+@pytest.fixture
+def count_statements():
+    """Context manager collecting the SQL of every statement the app's
+    engine executes inside it."""
+
+    @contextmanager
+    def counting():
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "after_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "after_cursor_execute", record)
+
+    return counting
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(sync_engine):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://budget") as client:
+        yield client
+
+    await task_events.close()
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def state(client, seed):
+    """A team with one user per role, some tasks assigned to the member,
+    and a bearer token per role."""
+    team_id = seed.team("budget-check")
+    password_hash = hash_password(PASSWORD)
+    users = {
+        role: seed.user(f"budget-{role.value.lower()}", role, team_id, password_hash)
+        for role in UserRole
+    }
+    seed.forget(REGISTER_EMAIL)
+
+    manager, member = users[UserRole.MANAGER], users[UserRole.MEMBER]
+    async with AsyncSessionLocal() as db:
+        # Enough for the member's list to have a second page
+        tasks = [
+            Task(
+                title=f"budget seed {i}",
+                created_by_id=manager.id,
+                assigned_to_id=member.id,
+                team_id=team_id,
+            )
+            for i in range(4)
+        ]
+        db.add_all(tasks)
+        await db.commit()
+
+    tokens = {}
+    for role, user in users.items():
+        response = await client.post(
+            "/auth/login", data={"username": user.email, "password": PASSWORD}
+        )
+        tokens[role] = response.json()["access_token"]
+
+    return {
+        "member_id": str(member.id),
+        "member_email": member.email,
+        "task_id": str(tasks[0].id),
+        "doomed_id": str(tasks[1].id),
+        "tokens": tokens,
+        "refresh_token": create_refresh_token(str(member.id)),
+    }
+
+
+async def first_chunk(path: str, headers: dict) -> httpx.Response:
+    """GET a streaming endpoint and disconnect after the first body chunk.
+
+    httpx's ASGI transport waits for the app to finish, which an event
+    stream never does, so this drives the ASGI app directly.
+    """
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("budget", 80),
+    }
+    sent: asyncio.Queue = asyncio.Queue()
+    disconnected = asyncio.Event()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    running = asyncio.create_task(app(scope, receive, sent.put))
+    try:
+        start = await asyncio.wait_for(sent.get(), timeout=5)
+        body = await asyncio.wait_for(sent.get(), timeout=5)
+    finally:
+        disconnected.set()
+        await asyncio.wait_for(running, timeout=5)
+
+    return httpx.Response(
+        start["status"],
+        headers=[(k.decode(), v.decode()) for k, v in start.get("headers", [])],
+        content=body.get("body", b""),
+    )
+
+
+@pytest.mark.parametrize("budget", BUDGETS, ids=[budget.name for budget in BUDGETS])
+async def test_statement_budget(client, state, count_statements, budget):
+    headers = {}
+    if budget.role is not None:
+        headers["Authorization"] = f"Bearer {state['tokens'][budget.role]}"
+        # Warm the auth cache outside the count
+        await client.get("/auth/me", headers=headers)
+    if budget.prime is not None:
+        primed = await client.get(budget.prime, headers=headers)
+        state = {**state, "etag": primed.headers["ETag"],
+                 "cursor": primed.headers["X-Next-Cursor"]}
+    headers.update(_fill(budget.headers or {}, state))
+    task_cache.clear()
+
+    with count_statements() as statements:
+        if budget.stream:
+            response = await first_chunk(_fill(budget.path, state), headers)
+        else:
+            response = await client.request(
+                budget.method,
+                _fill(budget.path, state),
+                headers=headers,
+                json=_fill(budget.json, state),
+                data=_fill(budget.data, state),
+                content=budget.content,
+            )
+
+    ran = "\n".join(" ".join(statement.split()) for statement in statements)
+    assert response.status_code == budget.expected_status, response.text[:200]
+    assert len(statements) <= budget.max_statements, (
+        f"{len(statements)} statements, budget {budget.max_statements}:\n{ran}"
+    )
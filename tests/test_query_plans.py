@@ -0,0 +1,173 @@
+"""Every list_tasks and task_changes query shape must be served by an index.
+
+Seeds a synthetic dataset inside a transaction that is rolled back, then
+runs EXPLAIN on the exact statements the endpoints build for each role
+and filter combination, and fails if a plan falls back to a sequential
+scan on ``tasks``.
+"""
+from enum import Enum
+from uuid import UUID, uuid4
+
+import psycopg2.extras
+import pytest
+from sqlalchemy import text
+
+from app.api.tasks import task_changes_query, task_list_query
+from app.core.principal import Principal
+from app.db.models.task import TaskStatus
+from app.db.models.user import UserRole
+
+psycopg2.extras.register_uuid()
+
+TEAMS = 200
+USERS_PER_TEAM = 20
+TASKS = 200_000
+
+SEED_SQL = [
+    """
+    CREATE TEMP TABLE seed_teams ON COMMIT DROP AS
+    SELECT g AS n, gen_random_uuid() AS id
+    FROM generate_series(1, :teams) g
+    """,
+    """
+    INSERT INTO teams (id, name)
+    SELECT id, 'plan-check-' || :run || '-' || n FROM seed_teams
+    """,
+    # User n belongs to team n % teams; the first user of each team is its manager
+    """
+    CREATE TEMP TABLE seed_users ON COMMIT DROP AS
+    SELECT g AS n, gen_random_uuid() AS id, t.id AS team_id,
+           CASE WHEN g <= :teams THEN 'MANAGER' ELSE 'MEMBER' END AS role
+    FROM generate_series(1, :teams * :users_per_team) g
+    JOIN seed_teams t ON t.n = 1 + g % :teams
+    """,
+    """
+    INSERT INTO users (id, email, password_hash, role, team_id)
+    SELECT id, 'plan-check-' || :run || '-' || n || '@example.com', 'x', role::userrole, team_id
+    FROM seed_users
+    """,
+    # Creator and assignee are always in the same team; 2% of rows are deleted
+    """
+    INSERT INTO tasks (
+        id, title, status, created_by_id, assigned_to_id, team_id,
+        is_deleted, created_at, updated_at
+    )
+    SELECT gen_random_uuid(),
+           'task ' || g,
+           (ARRAY['OPEN', 'IN_PROGRESS', 'DONE']::taskstatus[])[1 + g % 3],
+           c.id,
+           a.id,
+           c.team_id,
+           g % 50 = 0,
+           now() - g * interval '1 second',
+           now() - g * interval '1 second'
+    FROM generate_series(1, :tasks) g
+    JOIN seed_users c ON c.n = 1 + g % (:teams * :users_per_team)
+    JOIN seed_users a ON a.n = 1 + (g % (:teams * :users_per_team) + :teams) % (:teams * :users_per_team)
+    """,
+    "ANALYZE teams",
+    "ANALYZE users",
+    "ANALYZE tasks",
+]
+
+SHAPES = (
+    "admin",
+    "admin status",
+    "admin cursor",
+    "manager",
+    "manager status",
+    "manager assignee",
+    "manager cursor",
+    "member",
+    "member status",
+    "member cursor",
+    "changes admin",
+    "changes admin team",
+    "changes manager",
+    "changes member",
+)
+
+
+def _driver_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def explain(conn, query, params: dict) -> dict:
+    compiled = query.compile(dialect=conn.dialect)
+    params = {k: _driver_value(params.get(k, v)) for k, v in compiled.params.items()}
+    result = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+    return result.scalar()[0]["Plan"]
+
+
+def seq_scans(node: dict):
+    if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "tasks":
+        yield node
+    for child in node.get("Plans", []):
+        yield from seq_scans(child)
+
+
+@pytest.fixture(scope="module")
+def seeded(sync_engine):
+    # Everything, ANALYZE included, is rolled back at the end
+    with sync_engine.connect() as conn:
+        transaction = conn.begin()
+        params = {
+            "run": uuid4().hex[:8],
+            "teams": TEAMS,
+            "users_per_team": USERS_PER_TEAM,
+            "tasks": TASKS,
+        }
+        for statement in SEED_SQL:
+            conn.execute(text(statement), params)
+
+        yield conn
+        transaction.rollback()
+
+
+@pytest.fixture(scope="module")
+def shapes(seeded):
+    conn = seeded
+    manager_id, team_id = conn.execute(text(
+        "SELECT id, team_id FROM seed_users WHERE role = 'MANAGER' ORDER BY n LIMIT 1"
+    )).one()
+    member_id = conn.execute(text(
+        "SELECT id FROM seed_users WHERE role = 'MEMBER' AND team_id = :team ORDER BY n LIMIT 1"
+    ), {"team": team_id}).scalar_one()
+    page_two = tuple(conn.execute(text(
+        "SELECT created_at, id FROM tasks WHERE team_id = :team "
+        "ORDER BY created_at DESC, id DESC OFFSET 100 LIMIT 1"
+    ), {"team": team_id}).one())
+    watermark = tuple(conn.execute(text(
+        "SELECT change_xid, id FROM tasks WHERE team_id = :team "
+        "ORDER BY change_xid DESC, id DESC OFFSET 100 LIMIT 1"
+    ), {"team": team_id}).one())
+
+    admin = Principal(id=UUID(int=0), email="", role=UserRole.ADMIN, team_id=None)
+    manager = Principal(id=manager_id, email="", role=UserRole.MANAGER, team_id=team_id)
+    member = Principal(id=member_id, email="", role=UserRole.MEMBER, team_id=team_id)
+
+    return {
+        "admin": task_list_query(admin),
+        "admin status": task_list_query(admin, status=TaskStatus.DONE),
+        "admin cursor": task_list_query(admin, after=page_two),
+        "manager": task_list_query(manager),
+        "manager status": task_list_query(manager, status=TaskStatus.OPEN),
+        "manager assignee": task_list_query(manager, assignee_id=member_id),
+        "manager cursor": task_list_query(manager, after=page_two),
+        "member": task_list_query(member),
+        "member status": task_list_query(member, status=TaskStatus.IN_PROGRESS),
+        "member cursor": task_list_query(member, after=page_two),
+        "changes admin": task_changes_query(admin, after=watermark),
+        "changes admin team": task_changes_query(admin, team_id=team_id, after=watermark),
+        "changes manager": task_changes_query(manager, after=watermark),
+        "changes member": task_changes_query(member, after=watermark),
+    }
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_query_uses_an_index(seeded, shapes, shape):
+    query, params = shapes[shape]
+    plan = explain(seeded, query, params)
+    assert not list(seq_scans(plan)), f"{shape}: sequential scan on tasks"
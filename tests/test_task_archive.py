@@ -0,0 +1,118 @@
+"""scripts.archive_tasks end to end: batches move old deleted and DONE
+tasks to tasks_archive, record progress, and clear it on catching up."""
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from app.db.session import AsyncSessionLocal, engine
+from app.db.task_archive import PASSES, archive_pass
+from app.schemas.user import UserRole
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+SEED_SQL = """
+    INSERT INTO tasks (id, title, status, created_by_id, team_id, is_deleted, created_at, updated_at)
+    SELECT gen_random_uuid(), 'archive ' || g, :status, :user, :team, :is_deleted,
+           now() - interval '400 days', now() - :age * interval '1 day' - g * interval '1 second'
+    FROM generate_series(1, :count) g
+"""
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def team(sync_engine, seed):
+    team_id = seed.team("archive")
+    ids = {
+        "team": team_id,
+        "user": seed.user("archive", UserRole.MANAGER, team_id).id,
+        "run": team_id.hex[:8],
+    }
+    with sync_engine.begin() as conn:
+        # Deleted long enough ago, deleted recently, DONE long ago, live
+        for status, is_deleted, age, count in (
+            ("OPEN", True, 31, 5),
+            ("OPEN", True, 1, 2),
+            ("DONE", False, 181, 3),
+            ("DONE", False, 1, 2),
+        ):
+            conn.execute(text(SEED_SQL), {
+                **ids, "status": status, "is_deleted": is_deleted, "age": age, "count": count,
+            })
+
+    yield ids
+
+    await engine.dispose()
+
+
+def candidates(sync_engine, team, name: str, older_than_days: int) -> dict:
+    with sync_engine.connect() as conn:
+        rows = conn.execute(text(f"""
+            SELECT id, created_at, updated_at FROM tasks
+            WHERE team_id = :team AND {PASSES[name]}
+              AND updated_at < now() - make_interval(days => :days)
+        """), {**team, "days": older_than_days})
+        return {row.id: tuple(row) for row in rows}
+
+
+def archived_rows(sync_engine, ids) -> dict:
+    with sync_engine.connect() as conn:
+        rows = conn.execute(text("""
+            SELECT id, created_at, updated_at FROM tasks_archive WHERE id = ANY(:ids)
+        """), {"ids": list(ids)})
+        return {row.id: tuple(row) for row in rows}
+
+
+def progress(sync_engine, name: str):
+    with sync_engine.connect() as conn:
+        return conn.execute(
+            text("SELECT updated_at, task_id FROM task_archive_progress WHERE name = :name"),
+            {"name": name},
+        ).one_or_none()
+
+
+@pytest.mark.parametrize("name, older_than_days, archived", [
+    ("deleted", 30, 5),
+    ("done", 180, 3),
+])
+async def test_archive_pass_moves_old_tasks(sync_engine, team, name, older_than_days, archived):
+    expected = candidates(sync_engine, team, name, older_than_days)
+    assert len(expected) == archived
+    # Only this team's tasks, and progress of its own: other teams' tasks
+    # and a real run's progress are left alone
+    scope = {"team_id": team["team"], "progress_name": f"test-{name}-{team['run']}"}
+
+    # Stop after one batch: progress is saved for the next run
+    async with AsyncSessionLocal() as db:
+        await archive_pass(db, name, older_than_days, batch_size=2, pause=0, max_batches=1, **scope)
+    assert progress(sync_engine, scope["progress_name"]) is not None
+
+    # Resume and catch up: progress is cleared
+    async with AsyncSessionLocal() as db:
+        await archive_pass(db, name, older_than_days, batch_size=2, pause=0, **scope)
+    assert progress(sync_engine, scope["progress_name"]) is None
+
+    # Moved with their timestamps intact, and recent ones left alone
+    assert archived_rows(sync_engine, expected) == expected
+    assert candidates(sync_engine, team, name, older_than_days) == {}
+    assert len(candidates(sync_engine, team, name, 0)) == 2
+
+
+async def test_archived_id_fails_the_batch(sync_engine, team):
+    expected = candidates(sync_engine, team, "deleted", 30)
+    clash = next(iter(expected))
+    with sync_engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO tasks_archive
+                (id, title, status, created_by_id, team_id, is_deleted, created_at, updated_at)
+            SELECT id, 'archived before', status, created_by_id, team_id, is_deleted,
+                   created_at, updated_at
+            FROM tasks WHERE id = :id
+        """), {"id": clash})
+
+    async with AsyncSessionLocal() as db:
+        with pytest.raises(IntegrityError):
+            await archive_pass(db, "deleted", 30, batch_size=10, pause=0, team_id=team["team"],
+                               progress_name=f"test-clash-{team['run']}")
+
+    # Rolled back: nothing left tasks
+    assert candidates(sync_engine, team, "deleted", 30) == expected
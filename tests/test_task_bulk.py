@@ -0,0 +1,85 @@
+"""The bulk task endpoints: POST /tasks/bulk reports bad items one by one,
+and PATCH /tasks/bulk with a filter only works in pages of
+tasks_bulk_max_items, continued with next/after, and scoped to a team
+when one is given."""
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.api.tasks import create_tasks_bulk, update_tasks_bulk
+from app.core.config import settings
+from app.core.principal import Principal
+from app.db.session import AsyncSessionLocal, engine
+from app.schemas.task import TaskBulkFilter, TaskBulkUpdate, TaskCreate, TaskUpdate
+from app.schemas.user import UserRole
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+ADMIN = Principal(id=uuid.UUID(int=0), email="", role=UserRole.ADMIN, team_id=None)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def teams(sync_engine, seed):
+    team_a, team_b = seed.team("bulk-a"), seed.team("bulk-b")
+    ids = {
+        "team_a": team_a,
+        "team_b": team_b,
+        "user": seed.user("bulk", UserRole.MANAGER, team_a).id,
+    }
+    with sync_engine.begin() as conn:
+        for team, count in (("team_a", 5), ("team_b", 2)):
+            conn.execute(text("""
+                INSERT INTO tasks (id, title, status, created_by_id, team_id)
+                SELECT gen_random_uuid(), 'bulk ' || g, 'OPEN', :user, :team
+                FROM generate_series(1, :count) g
+            """), {**ids, "team": ids[team], "count": count})
+
+    yield ids
+
+    await engine.dispose()
+
+
+async def test_filter_update_is_paged(sync_engine, teams, monkeypatch):
+    monkeypatch.setattr(settings, "tasks_bulk_max_items", 2)
+    data = TaskBulkUpdate(
+        filter=TaskBulkFilter(team_id=teams["team_a"]),
+        patch=TaskUpdate(description="bulk"),
+    )
+
+    pages = []
+    async with AsyncSessionLocal() as db:
+        while True:
+            result = await update_tasks_bulk(data, db, ADMIN)
+            pages.append(result.updated)
+            if result.next is None:
+                break
+            data = data.model_copy(update={"after": result.next})
+
+    # Full pages carry a next; the short last one does not
+    assert pages == [2, 2, 1]
+    with sync_engine.connect() as conn:
+        described = dict(conn.execute(text("""
+            SELECT team_id, count(*) FILTER (WHERE description = 'bulk')
+            FROM tasks WHERE team_id = ANY(:teams) GROUP BY team_id
+        """), {"teams": [teams["team_a"], teams["team_b"]]}).all())
+    assert described == {teams["team_a"]: 5, teams["team_b"]: 0}
+
+
+async def test_long_title_fails_its_own_item(teams):
+    manager = Principal(id=teams["user"], email="", role=UserRole.MANAGER, team_id=teams["team_a"])
+    items = [
+        TaskCreate(title=title, assignee_id=teams["user"])
+        for title in ("bulk short", "x" * 256, "bulk short too")
+    ]
+
+    async with AsyncSessionLocal() as db:
+        results = await create_tasks_bulk(items, db, manager)
+
+    assert [result.error for result in results] == [
+        None, "title is longer than 255 characters", None,
+    ]
+    assert [result.task.title for result in results if result.task] == [
+        "bulk short", "bulk short too",
+    ]
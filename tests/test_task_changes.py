@@ -0,0 +1,104 @@
+"""GET /tasks/changes: the watermark follows commit order, so a write that
+commits late is still delivered, and MEMBERs are told about tasks taken
+away from them."""
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.api.tasks import task_changes_query
+from app.core.principal import Principal
+from app.schemas.user import UserRole
+
+ADMIN = Principal(id=uuid.UUID(int=0), email="", role=UserRole.ADMIN, team_id=None)
+
+
+@pytest.fixture
+def tasks(sync_engine, seed):
+    """One task in each of two teams: writers on different teams do not
+    wait for each other."""
+    team_a, team_b = seed.team("changes-a"), seed.team("changes-b")
+    ids = {
+        "team_a": team_a,
+        "team_b": team_b,
+        "creator": seed.user("changes", UserRole.ADMIN).id,
+        "member_1": seed.user("changes-1", UserRole.MEMBER, team_a).id,
+        "member_2": seed.user("changes-2", UserRole.MEMBER, team_a).id,
+        "first": uuid.uuid4(),
+        "second": uuid.uuid4(),
+    }
+    with sync_engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO tasks (id, title, status, created_by_id, team_id) VALUES
+                (:first, 'first', 'OPEN', :creator, :team_a),
+                (:second, 'second', 'OPEN', :creator, :team_b)
+        """), ids)
+
+    return ids
+
+
+def changes(sync_engine, after, principal: Principal = ADMIN) -> list:
+    query, params = task_changes_query(principal, after=after)
+    with sync_engine.connect() as conn:
+        return conn.execute(query, params).all()
+
+
+def seeded_watermark(sync_engine, tasks) -> tuple:
+    # Just past the seeding transaction
+    with sync_engine.connect() as conn:
+        seeded = conn.execute(
+            text("SELECT change_xid FROM tasks WHERE id = :first"), tasks
+        ).scalar_one()
+    return seeded, uuid.UUID(int=2**128 - 1)
+
+
+def test_late_commit_is_not_skipped(sync_engine, tasks):
+    watermark = seeded_watermark(sync_engine, tasks)
+
+    # A slow writer starts first, a quick one commits before it
+    with sync_engine.connect() as slow:
+        slow_transaction = slow.begin()
+        slow.execute(text("UPDATE tasks SET title = 'slow' WHERE id = :first"), tasks)
+
+        with sync_engine.begin() as quick:
+            quick.execute(text("UPDATE tasks SET title = 'quick' WHERE id = :second"), tasks)
+
+        # Handing out the quick write now would move the watermark past
+        # the slow one
+        assert changes(sync_engine, watermark) == []
+
+        slow_transaction.commit()
+
+    rows = changes(sync_engine, watermark)
+    assert [row.title for row in rows] == ["slow", "quick"]
+
+
+def test_reassigned_task_is_removed_for_member(sync_engine, tasks):
+    watermark = seeded_watermark(sync_engine, tasks)
+    member_1, member_2 = (
+        Principal(id=tasks[name], email="", role=UserRole.MEMBER, team_id=tasks["team_a"])
+        for name in ("member_1", "member_2")
+    )
+    reassign = text("UPDATE tasks SET assigned_to_id = :user WHERE id = :first")
+
+    with sync_engine.begin() as conn:
+        conn.execute(reassign, {**tasks, "user": tasks["member_1"]})
+    after_assigned = changes(sync_engine, watermark, member_1)
+    assert [(row.id, row.is_deleted) for row in after_assigned] == [(tasks["first"], False)]
+    watermark = (after_assigned[-1].change_xid, after_assigned[-1].id)
+
+    with sync_engine.begin() as conn:
+        conn.execute(reassign, {**tasks, "user": tasks["member_2"]})
+    assert [(row.id, row.is_deleted) for row in changes(sync_engine, watermark, member_1)] == [
+        (tasks["first"], True),
+    ]
+    assert [(row.id, row.is_deleted) for row in changes(sync_engine, watermark, member_2)] == [
+        (tasks["first"], False),
+    ]
+
+    # Back again: the live row, and no stale removal
+    with sync_engine.begin() as conn:
+        conn.execute(reassign, {**tasks, "user": tasks["member_1"]})
+    assert [(row.id, row.is_deleted) for row in changes(sync_engine, watermark, member_1)] == [
+        (tasks["first"], False),
+    ]
@@ -0,0 +1,141 @@
+"""Task events end to end: writes on tasks, the NOTIFY trigger, and the
+broker fanning events out to the subscribers who may see them."""
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.core.task_events import TaskEventBroker, task_events
+from app.schemas.user import UserRole
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# name: (role, team)
+USERS = {
+    "admin": (UserRole.ADMIN, None),
+    "manager_a": (UserRole.MANAGER, "team_a"),
+    "manager_b": (UserRole.MANAGER, "team_b"),
+    "member_1": (UserRole.MEMBER, "team_a"),
+    "member_2": (UserRole.MEMBER, "team_a"),
+}
+
+
+@pytest.fixture(scope="module")
+def principals(seed):
+    teams = {team: seed.team(f"events-{team}") for team in ("team_a", "team_b")}
+    return {
+        name: seed.user(f"events-{name}", role, teams[team] if team else None)
+        for name, (role, team) in USERS.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def people(principals):
+    """Ids of the users, and of their teams."""
+    return {
+        **{name: principal.id for name, principal in principals.items()},
+        "team_a": principals["manager_a"].team_id,
+        "team_b": principals["manager_b"].team_id,
+    }
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def subscribers(principals, sync_engine):
+    broker = TaskEventBroker(task_events.dsn, reconnect_seconds=0.1, revalidate_seconds=0.1)
+    subscribed = {name: broker.subscribe(principal) for name, principal in principals.items()}
+
+    # The listener connects in the background; ping until it hears
+    admin = subscribed["admin"]
+    for _ in range(50):
+        with sync_engine.begin() as conn:
+            conn.execute(text("""SELECT pg_notify('task_events', '{"op": "resync"}')"""))
+        try:
+            await asyncio.wait_for(admin.queue.get(), timeout=0.1)
+            break
+        except asyncio.TimeoutError:
+            pass
+    await asyncio.sleep(0.1)
+    for subscriber in subscribed.values():
+        drain(subscriber)
+
+    yield subscribed
+
+    for subscriber in subscribed.values():
+        broker.unsubscribe(subscriber)
+    await broker.close()
+
+
+def drain(subscriber) -> list[dict]:
+    events = []
+    while not subscriber.queue.empty():
+        events.append(subscriber.queue.get_nowait())
+    return events
+
+
+async def next_event(subscriber) -> dict:
+    return await asyncio.wait_for(subscriber.queue.get(), timeout=5)
+
+
+def write(sync_engine, sql: str, params: dict):
+    with sync_engine.begin() as conn:
+        result = conn.execute(text(sql), params)
+        return result.scalar() if result.returns_rows else None
+
+
+async def test_reassignment_reaches_old_and_new_audience(sync_engine, people, subscribers):
+    task_id = write(sync_engine, """
+        INSERT INTO tasks (id, title, status, created_by_id, assigned_to_id, team_id)
+        VALUES (gen_random_uuid(), 'events', 'OPEN', :manager_a, :member_1, :team_a)
+        RETURNING id
+    """, people)
+    for name in ("admin", "manager_a", "member_1"):
+        event = await next_event(subscribers[name])
+        assert (event["op"], event["id"]) == ("created", str(task_id))
+
+    # A bulk-style UPDATE moving the task to another assignee
+    write(sync_engine, """
+        UPDATE tasks SET assigned_to_id = :member_2, updated_at = now()
+        WHERE id = ANY(:ids)
+    """, {**people, "ids": [task_id]})
+    for name in ("admin", "manager_a", "member_1", "member_2"):
+        event = await next_event(subscribers[name])
+        assert (event["op"], event["id"]) == ("updated", str(task_id))
+        assert event["previous_assigned_to_id"] == str(people["member_1"])
+        assert event["assigned_to_id"] == str(people["member_2"])
+
+    # The archiver's DELETE
+    write(sync_engine, "DELETE FROM tasks WHERE id = :task_id", {"task_id": task_id})
+    for name in ("admin", "manager_a", "member_2"):
+        event = await next_event(subscribers[name])
+        assert (event["op"], event["id"]) == ("archived", str(task_id))
+
+    await asyncio.sleep(0.1)
+    assert drain(subscribers["manager_b"]) == []
+    assert drain(subscribers["member_1"]) == []
+
+
+async def test_large_statement_sends_one_resync(sync_engine, people, subscribers):
+    # As a COPY import or a big bulk create would
+    write(sync_engine, """
+        INSERT INTO tasks (id, title, status, created_by_id, team_id)
+        SELECT gen_random_uuid(), 'events ' || g, 'OPEN', :manager_b, :team_b
+        FROM generate_series(1, 1001) g
+    """, people)
+    for subscriber in subscribers.values():
+        assert await next_event(subscriber) == {"op": "resync"}
+
+    await asyncio.sleep(0.1)
+    for subscriber in subscribers.values():
+        assert drain(subscriber) == []
+
+
+async def test_stale_principal_is_closed(sync_engine, people, subscribers):
+    write(sync_engine, "UPDATE users SET team_id = :team_b WHERE id = :member_1", people)
+
+    assert await next_event(subscribers["member_1"]) == {"op": "closed"}
+    assert subscribers["member_1"].closed
+    await asyncio.sleep(0.3)
+    assert not any(
+        subscriber.closed for name, subscriber in subscribers.items() if name != "member_1"
+    )